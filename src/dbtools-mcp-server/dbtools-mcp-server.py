@@ -4,6 +4,7 @@ Licensed under the Universal Permissive License v1.0 as shown at http://oss.orac
 """
 
 import os.path
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 import json
@@ -16,6 +17,7 @@ from fastmcp import FastMCP
 
 MODEL_NAME = os.getenv("MODEL_NAME", "MINILM_L12_V2")
 MODEL_EMBEDDING_DIMENSION = int(os.getenv("MODEL_EMBEDDING_DIMENSION", "384"))
+CONNECTION_FETCH_WORKERS = 8
 mcp = FastMCP("oci")
 
 
@@ -40,45 +42,55 @@ auth_signer = Signer(
 )
 tenancy_id = os.getenv("TENANCY_ID_OVERRIDE", config['tenancy'])
 
-def list_all_compartments_internal(only_one_page: bool , limit = 100  ):
-    """Internal function to get List all compartments in a tenancy"""
-    response = identity_client.list_compartments(
+def iter_compartments(limit = 1000):
+    """Internal generator yielding accessible active compartments page by page"""
+    page = None
+    while True:
+        response = oci.retry.DEFAULT_RETRY_STRATEGY.make_retrying_call(
+            identity_client.list_compartments,
             compartment_id=tenancy_id,
             compartment_id_in_subtree=True,
             access_level="ACCESSIBLE",
             lifecycle_state="ACTIVE",
+            page=page,
             limit = limit
-       )
-    compartments = response.data
-    compartments.append(identity_client.get_compartment(compartment_id=tenancy_id).data)
-    if only_one_page : # limiting the number of items returned
-        return  compartments   
-    while response.has_next_page:
-        response = identity_client.list_compartments(
+        )
+        yield from response.data
+        page = response.next_page
+        if not page:
+            break
+
+def list_all_compartments_internal(limit = 100):
+    """Internal function to get List all compartments in a tenancy"""
+    # limiting the number of items returned to a single page
+    response = identity_client.list_compartments(
             compartment_id=tenancy_id,
             compartment_id_in_subtree=True,
             access_level="ACCESSIBLE",
             lifecycle_state="ACTIVE",
-            page=response.next_page,
             limit = limit
-        )
-        compartments.extend(response.data)
-    
+       )
+    compartments = response.data
+    compartments.append(identity_client.get_compartment(compartment_id=tenancy_id).data)
     return compartments
 
 @mcp.tool()
 def list_all_compartments() -> str:
     """List all compartments in a tenancy with clear formatting"""
-    return str(list_all_compartments_internal(True))
+    return str(list_all_compartments_internal())
 
 def get_compartment_by_name(compartment_name: str):
     """Internal function to get compartment by name with caching"""
-    compartments = list_all_compartments_internal(False)
-    # Search for the compartment by name
-    for compartment in compartments:
-        if compartment.name.lower() == compartment_name.lower():
+    # Search page by page so a match stops the listing early
+    compartment_name = compartment_name.lower()
+    for compartment in iter_compartments():
+        if compartment.name.lower() == compartment_name:
             return compartment
 
+    root = identity_client.get_compartment(compartment_id=tenancy_id).data
+    if root.name.lower() == compartment_name:
+        return root
+
     return None
 
 @mcp.tool()
@@ -134,18 +146,19 @@ def list_all_connections() -> str:
     if not hasattr(search_results, 'items'):
         return json.dumps([])
 
-    # Get full details for each connection
-    detailed_results = []
-    for item in search_results.items:
+    def get_connection_details(item):
         try:
-            connection = dbtools_client.get_database_tools_connection(item.identifier).data
-            detailed_results.append(connection)
+            return dbtools_client.get_database_tools_connection(item.identifier).data
         except Exception as e:
             # If we can't get details for a connection, include error info
-            detailed_results.append({
+            return {
                 "error": f"Error getting details for connection {item.display_name}: {str(e)}",
                 "search_result": item.identifier
-            })
+            }
+
+    # Get full details for each connection, fetched concurrently in search order
+    with ThreadPoolExecutor(max_workers=CONNECTION_FETCH_WORKERS) as executor:
+        detailed_results = list(executor.map(get_connection_details, search_results.items))
     
     return str(detailed_results)
 
@@ -157,7 +170,7 @@ def get_dbtools_connection_by_name_tool(display_name: str) -> str:
         type="Structured",
         matching_context_type="NONE"
     )
-    search_results = search_client.search_resources(search_details=search_details, tenant_id=config['tenancy']).data
+    search_results = search_client.search_resources(search_details=search_details, tenant_id=config['tenancy'], limit=1).data
     
     if not hasattr(search_results, 'items') or len(search_results.items) == 0:
         return json.dumps({
@@ -183,7 +196,7 @@ def get_minimal_connection_by_name(dbtools_connection_display_name: str):
         matching_context_type="NONE"
     )
     try:
-        resp = search_client.search_resources(search_details=search_details, tenant_id=config['tenancy']).data
+        resp = search_client.search_resources(search_details=search_details, tenant_id=config['tenancy'], limit=1).data
         
         if not hasattr(resp, 'items') or len(resp.items) == 0:
             return None
@@ -12,6 +12,8 @@ import oci
 from fastmcp import FastMCP
 from mysql import connector
 from mysql.connector.abstracts import MySQLConnectionAbstract
+from pydantic_core import to_json
+
 from oracle.mysql_mcp_server.utils import (
     DatabaseConnectionError,
     Mode,
@@ -266,19 +268,6 @@ def execute_sql_tool_by_connection_id(
     return _execute_sql_tool(connection_id, sql_script, params=params)
 
 
-from datetime import date, datetime
-from decimal import Decimal
-
-
-class CustomJSONEncoder(json.JSONEncoder):
-    def default(self, o):
-        if isinstance(o, Decimal):
-            return str(o)
-        if isinstance(o, (date, datetime)):
-            return o.isoformat()
-        return super().default(o)
-
-
 def _execute_sql_tool(
     connection: Union[str, MySQLConnectionAbstract],
     sql_script: str,
@@ -330,7 +319,10 @@ def _execute_sql_tool(
 
             db_connection.commit()
 
-            return json.dumps(results, cls=CustomJSONEncoder)
+            # pydantic_core encodes rows in compiled code and writes the Decimal, date and
+            # datetime values MySQL returns as strings, as json.dumps did with a custom encoder.
+            # It also encodes TIME (timedelta), SET and UTF-8 BLOB values, which that rejected.
+            return to_json(results).decode()
 
     except Exception as e:
         return json.dumps(
@@ -506,6 +506,63 @@ class TestExecuteSqlTool(unittest.TestCase):
         self.assertIsNone(json.loads(out))
         mock_conn.commit.assert_called_once()
 
+    def test_execute_sql_tool_encodes_decimal_and_dates_as_strings(self):
+        from datetime import date, datetime
+        from decimal import Decimal
+
+        mock_cursor_cm = mock.MagicMock()
+        mock_cursor = mock_cursor_cm.__enter__.return_value
+        mock_cursor.with_rows = True
+        mock_cursor.fetchall.return_value = [
+            (1, Decimal("1.50"), datetime(2024, 1, 2, 3, 4, 5), date(2024, 1, 2), None)
+        ]
+        mock_cursor.nextset.return_value = None
+        mock_conn = mock.MagicMock()
+        mock_conn.cursor.return_value = mock_cursor_cm
+
+        out = src_module._execute_sql_tool(mock_conn, "SELECT * FROM t")
+        self.assertFalse(src_module.check_error(out))
+        self.assertEqual(
+            json.loads(out), [[1, "1.50", "2024-01-02T03:04:05", "2024-01-02", None]]
+        )
+
+    def test_execute_sql_tool_encodes_other_column_types(self):
+        from datetime import datetime, timedelta, timezone
+
+        mock_cursor_cm = mock.MagicMock()
+        mock_cursor = mock_cursor_cm.__enter__.return_value
+        mock_cursor.with_rows = True
+        # TIME columns come back as timedelta, SET columns as set and BLOB columns as bytes
+        mock_cursor.fetchall.return_value = [
+            (
+                datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+                timedelta(hours=1, minutes=2, seconds=3),
+                {"a"},
+                b"abc",
+            )
+        ]
+        mock_cursor.nextset.return_value = None
+        mock_conn = mock.MagicMock()
+        mock_conn.cursor.return_value = mock_cursor_cm
+
+        out = src_module._execute_sql_tool(mock_conn, "SELECT * FROM t")
+        self.assertFalse(src_module.check_error(out))
+        self.assertEqual(
+            json.loads(out), [["2024-01-02T03:04:05Z", "PT1H2M3S", ["a"], "abc"]]
+        )
+
+    def test_execute_sql_tool_reports_non_utf8_bytes_as_error(self):
+        mock_cursor_cm = mock.MagicMock()
+        mock_cursor = mock_cursor_cm.__enter__.return_value
+        mock_cursor.with_rows = True
+        mock_cursor.fetchall.return_value = [(b"\xff",)]
+        mock_cursor.nextset.return_value = None
+        mock_conn = mock.MagicMock()
+        mock_conn.cursor.return_value = mock_cursor_cm
+
+        out = src_module._execute_sql_tool(mock_conn, "SELECT * FROM t")
+        self.assertTrue(src_module.check_error(out))
+
     def test_execute_sql_tool_closes_when_connection_id_used_no_result_set(self):
         mock_conn = mock.MagicMock()
         mock_cursor_cm = mock.MagicMock()
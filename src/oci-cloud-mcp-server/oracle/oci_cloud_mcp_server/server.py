@@ -4,10 +4,14 @@ Licensed under the Universal Permissive License v1.0 as shown at
 https://oss.oracle.com/licenses/upl.
 """
 
+import atexit
+import datetime
 import inspect
-import json
+import operator
 import os
 import re
+import threading
+from collections.abc import Iterable, Mapping
 from importlib import import_module
 from logging import Logger
 from typing import Annotated, Any, Callable, Dict, List, Optional, Tuple
@@ -28,6 +32,8 @@ mcp = FastMCP(
         This server provides tools to interact directly with the OCI Python SDK,
         invoking API clients and operations in-process (no CLI).
         - invoke_oci_api: Call any OCI SDK client operation by FQN and method.
+          List operations return all results unless 'limit' is given. When more results
+          are available the response includes 'next_page'; pass it back as params['page'].
         - list_client_operations: Discover available operations on a client.
     """,
 )
@@ -40,6 +46,85 @@ _ADDITIONAL_UA = f"{_user_agent_name}/{__version__}"
 # in any residual fallback checks.
 known_paginated: set = set()
 
+# Parsed OCI config profiles keyed by (config file path, profile name). Each entry
+# remembers the config file's mtime so edits on disk are picked up on the next call.
+_CONFIG_CACHE: Dict[Tuple[str, str], Tuple[int, Dict[str, Any]]] = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+# Signers keyed like _CONFIG_CACHE. Each entry remembers the config it was built from
+# and the mtimes of the key and security token files, so a refreshed session token
+# (e.g. `oci session refresh`) yields a new signer.
+_SIGNER_CACHE: Dict[Tuple[str, str], Tuple[Dict[str, Any], Tuple[Optional[int], ...], Any]] = {}
+
+# OCI SDK clients keyed by client class, together with the signer they were built
+# with. Reusing a client keeps its requests.Session, and with it the pooled
+# TLS connections, alive across tool calls.
+_CLIENT_CACHE: Dict[Any, Tuple[Any, Any]] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+# Retry strategy for SDK clients: backs off on throttling (429), 5xx and timeouts.
+# Built once and shared by every client instead of per call.
+_RETRY_STRATEGY = oci.retry.RetryStrategyBuilder(
+    max_attempts_check=True,
+    max_attempts=5,
+    total_elapsed_time_check=True,
+    total_elapsed_time_seconds=60,
+    retry_max_wait_between_calls_seconds=10,
+    retry_base_sleep_time_seconds=1,
+    backoff_type=oci.retry.BACKOFF_FULL_JITTER_EQUAL_ON_THROTTLE_VALUE,
+).get_retry_strategy()
+
+# Patterns used to introspect SDK operations, compiled once at import.
+_EXPECTED_KWARGS_RE = re.compile(r"expected_kwargs\s*=\s*\[\s*(.*?)\s*\]", re.DOTALL)
+_QUOTED_NAME_RE = re.compile(r"['\"]([a-zA-Z0-9_]+)['\"]")
+_PAGINATION_PARAM_RE = re.compile(r"\b(page|limit)\b")
+
+# expected_kwargs sets parsed from SDK method sources, keyed by function.
+_EXPECTED_KWARGS_CACHE: Dict[Any, set] = {}
+
+# Parameter names, required parameter names and whether **kwargs is accepted, for
+# SDK operations keyed by function, see _signature_params.
+_SIGNATURE_CACHE: Dict[Any, Tuple[frozenset, Tuple[str, ...], bool]] = {}
+_REQUIRED_KINDS = (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+
+# Field names and attrgetters of OCI SDK model classes, see _model_fields.
+_MODEL_FIELDS: Dict[type, Tuple[Tuple[str, ...], Callable[[Any], Tuple[Any, ...]]]] = {}
+_MISSING = object()
+
+
+def _config_key() -> Tuple[str, str]:
+    return (
+        os.getenv("OCI_CONFIG_FILE", oci.config.DEFAULT_LOCATION),
+        os.getenv("OCI_CONFIG_PROFILE", oci.config.DEFAULT_PROFILE),
+    )
+
+
+def _mtime_ns(path: str) -> Optional[int]:
+    try:
+        return os.stat(os.path.expanduser(path)).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _load_config() -> Dict[str, Any]:
+    """
+    Load the OCI config profile, re-parsing the config file only when it has changed.
+    Returns a fresh copy on every call so callers may mutate it safely.
+    """
+    key = _config_key()
+    file_location, profile_name = key
+    mtime_ns = _mtime_ns(file_location)
+
+    with _CONFIG_CACHE_LOCK:
+        cached = _CONFIG_CACHE.get(key)
+        if mtime_ns is not None and cached is not None and cached[0] == mtime_ns:
+            return dict(cached[1])
+
+        config = oci.config.from_file(file_location=file_location, profile_name=profile_name)
+        if mtime_ns is not None:
+            _CONFIG_CACHE[key] = (mtime_ns, dict(config))
+        return config
+
 
 def _get_config_and_signer() -> Tuple[Dict[str, Any], Any]:
     """
@@ -49,9 +134,37 @@ def _get_config_and_signer() -> Tuple[Dict[str, Any], Any]:
     - If a security_token_file exists, use SecurityTokenSigner (session auth).
     - Otherwise, fall back to API key Signer from config.
     """
-    config = oci.config.from_file(profile_name=os.getenv("OCI_CONFIG_PROFILE", oci.config.DEFAULT_PROFILE))
+    config = _load_config()
     config["additional_user_agent"] = _ADDITIONAL_UA
 
+    key = _config_key()
+    stamp = _credential_files_stamp(config)
+    if stamp is not None:
+        with _CONFIG_CACHE_LOCK:
+            cached = _SIGNER_CACHE.get(key)
+        if cached is not None and cached[0] == config and cached[1] == stamp:
+            return config, cached[2]
+
+    signer = _build_signer(config)
+    if stamp is not None:
+        with _CONFIG_CACHE_LOCK:
+            _SIGNER_CACHE[key] = (dict(config), stamp, signer)
+    return config, signer
+
+
+def _credential_files_stamp(config: Dict[str, Any]) -> Optional[Tuple[Optional[int], ...]]:
+    """
+    Return the mtimes of the files a signer is built from, or None when the key file
+    cannot be stat'ed (in which case the signer is not cached).
+    """
+    key_mtime = _mtime_ns(config.get("key_file", "") or "")
+    if key_mtime is None:
+        return None
+    token_file = config.get("security_token_file", "") or ""
+    return (key_mtime, _mtime_ns(token_file) if token_file else None)
+
+
+def _build_signer(config: Dict[str, Any]) -> Any:
     # try security token
     token_file = os.path.expanduser(config.get("security_token_file", "") or "")
     try:
@@ -87,7 +200,7 @@ def _get_config_and_signer() -> Tuple[Dict[str, Any], Any]:
             logger.error(f"Failed to build API key Signer: {e}")
             raise
 
-    return config, signer
+    return signer
 
 
 def _import_client(client_fqn: str) -> Any:
@@ -103,10 +216,40 @@ def _import_client(client_fqn: str) -> Any:
     if not inspect.isclass(cls):
         raise ValueError(f"{client_fqn} is not a class")
     config, signer = _get_config_and_signer()
-    instance = cls(config, signer=signer)
+    with _CLIENT_CACHE_LOCK:
+        cached = _CLIENT_CACHE.get(cls)
+        if cached is not None and cached[0] is signer:
+            return cached[1]
+        kwargs: Dict[str, Any] = {"signer": signer}
+        if cls.__module__.startswith("oci."):
+            # SDK clients do not retry unless given a strategy; share one across all clients
+            kwargs["retry_strategy"] = _RETRY_STRATEGY
+        instance = cls(config, **kwargs)
+        _CLIENT_CACHE[cls] = (signer, instance)
+    if cached is not None:
+        # the client built with the previous signer is no longer handed out
+        _close_client(cached[1])
     return instance
 
 
+def _close_client(client: Any) -> None:
+    session = getattr(getattr(client, "base_client", None), "session", None)
+    if session is not None:
+        try:
+            session.close()
+        except Exception as e:
+            logger.warning(f"Failed to close client session: {e}")
+
+
+@atexit.register
+def _close_cached_clients() -> None:
+    with _CLIENT_CACHE_LOCK:
+        clients = [client for _, client in _CLIENT_CACHE.values()]
+        _CLIENT_CACHE.clear()
+    for client in clients:
+        _close_client(client)
+
+
 def _snake_to_camel(name: str) -> str:
     parts = name.split("_")
     return "".join(p.capitalize() for p in parts if p)
@@ -305,6 +448,47 @@ def _coerce_params_to_oci_models(client_fqn: str, operation: str, params: Dict[s
     return out
 
 
+def _signature_params(method: Callable[..., Any]) -> Optional[Tuple[frozenset, Tuple[str, ...], bool]]:
+    """
+    Return the parameter names of an SDK operation, the names, in order, of the parameters
+    that have no default, and whether it accepts **kwargs. Returns None if the signature
+    cannot be read.
+    Results are cached per function so the signature is inspected once, not on every call.
+    """
+    func = getattr(method, "__func__", method)
+    cached = _SIGNATURE_CACHE.get(func)
+    if cached is not None:
+        return cached
+    try:
+        parameters = inspect.signature(method).parameters
+    except Exception:
+        return None
+    required = tuple(
+        name for name, p in parameters.items() if p.kind in _REQUIRED_KINDS and p.default is p.empty
+    )
+    var_keyword = any(p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters.values())
+    cached = _SIGNATURE_CACHE[func] = (frozenset(parameters), required, var_keyword)
+    return cached
+
+
+def _check_required_params(method: Callable[..., Any], operation_name: str, params: Dict[str, Any]) -> None:
+    """
+    Raise ValueError naming every required parameter of the operation missing from params,
+    before any model coercion or pagination work is done for the call.
+    """
+    signature = _signature_params(method)
+    if signature is None:
+        return
+    names, required, var_keyword = signature
+    if not var_keyword and not names.issuperset(params):
+        # the call itself reports unexpected keywords, which drives the create_/update_
+        # aliasing fallback in _call_with_pagination_if_applicable
+        return
+    missing = [name for name in required if name not in params]
+    if missing:
+        raise ValueError(f"Missing required parameters for '{operation_name}': {', '.join(missing)}")
+
+
 def _align_params_to_signature(
     method: Callable[..., Any], operation_name: str, params: Dict[str, Any]
 ) -> Dict[str, Any]:
@@ -314,11 +498,10 @@ def _align_params_to_signature(
     'create_<resource>_details'/'update_<resource>_details' when the latter exists
     in the target method signature.
     """
-    try:
-        sig = inspect.signature(method)
-        param_names = set(sig.parameters.keys())
-    except Exception:
+    signature = _signature_params(method)
+    if signature is None:
         return params
+    param_names = signature[0]
 
     aligned = dict(params)
     if operation_name.startswith("create_") or operation_name.startswith("update_"):
@@ -330,6 +513,60 @@ def _align_params_to_signature(
     return aligned
 
 
+def _model_fields(obj: Any) -> Tuple[Tuple[str, ...], Callable[[Any], Tuple[Any, ...]]]:
+    """
+    Return the swagger field names of an OCI model together with an
+    operator.attrgetter that reads all of them in one call. OCI models set
+    swagger_types per instance, but it is fixed per class, so SDK model
+    classes are cached; anything else is computed per object.
+    """
+    cls = type(obj)
+    cached = _MODEL_FIELDS.get(cls)
+    if cached is not None:
+        return cached
+    keys = tuple(obj.swagger_types)
+    if len(keys) > 1:
+        getter = operator.attrgetter(*keys)
+    else:
+        getter = lambda o: tuple(getattr(o, k) for k in keys)  # noqa: E731
+    if cls.__module__.startswith("oci."):
+        _MODEL_FIELDS[cls] = (keys, getter)
+    return keys, getter
+
+
+def _to_jsonable(obj: Any) -> Any:
+    """
+    Single-pass equivalent of oci.util.to_dict followed by the JSON-safety walk in
+    _serialize_oci_data, reading model fields through _model_fields.
+    """
+    if obj is None or isinstance(obj, (str, bool, int, float)):
+        return obj
+    if obj is oci.util.NONE_SENTINEL:
+        return None
+    if isinstance(obj, (datetime.datetime, datetime.time)):
+        # always use UTC, as oci.util.to_dict does
+        if not obj.tzinfo:
+            obj = obj.replace(tzinfo=datetime.timezone.utc)
+        if isinstance(obj, datetime.datetime):
+            return obj.isoformat(sep="T")
+        return obj.isoformat()
+    if isinstance(obj, datetime.date):
+        return obj.isoformat()
+    if isinstance(obj, Mapping):
+        return {k: _to_jsonable(v) for k, v in obj.items()}
+    if isinstance(obj, Iterable):
+        return [_to_jsonable(v) for v in obj]
+    if not hasattr(obj, "swagger_types"):
+        return str(obj)
+    keys, getter = _model_fields(obj)
+    try:
+        values = getter(obj)
+    except AttributeError:
+        # a declared attribute is missing: skip it like oci.util.to_dict does
+        return {k: _to_jsonable(v) for k in keys if (v := getattr(obj, k, _MISSING)) is not _MISSING}
+    return {k: _to_jsonable(v) for k, v in zip(keys, values)}
+
+
 def _serialize_oci_data(data: Any) -> Any:
     """
     Convert OCI SDK model objects or collections into JSON-serializable structures.
@@ -343,12 +580,16 @@ def _serialize_oci_data(data: Any) -> Any:
             return [ensure_jsonable(x) for x in obj]
         if isinstance(obj, dict):
             return {k: ensure_jsonable(v) for k, v in obj.items()}
+        # json can only encode the types handled above, so anything else becomes a string
+        # (FastMCP encodes the final result with pydantic_core, no json round trip is needed)
+        return str(obj)
+
+    # SDK models and list responses take the single-pass path
+    if isinstance(data, list) or hasattr(data, "swagger_types"):
         try:
-            json.dumps(obj)
-            return obj
+            return _to_jsonable(data)
         except Exception:
-            return str(obj)
-
+            pass
     try:
         converted = oci.util.to_dict(data)
     except Exception:
@@ -360,21 +601,24 @@ def _extract_expected_kwargs_from_source(method: Callable[..., Any]) -> Optional
     """
     Best-effort extraction of the SDK generator's 'expected_kwargs' list from the method source.
     Returns a set of kwarg names if found, None if source cannot be retrieved, or empty set if
-    the pattern isn't present.
+    the pattern isn't present. Results are cached per function since reading and scanning the
+    source is by far the most expensive step of invoking a non-list operation.
     """
+    func = getattr(method, "__func__", method)
+    cached = _EXPECTED_KWARGS_CACHE.get(func)
+    if cached is not None:
+        return cached
     try:
         src = inspect.getsource(method)
     except Exception:
         return None
     try:
-        m = re.search(r"expected_kwargs\s*=\s*\[\s*(.*?)\s*\]", src, re.DOTALL)
-        if not m:
-            return set()
-        body = m.group(1)
-        kws = set(re.findall(r"['\"]([a-zA-Z0-9_]+)['\"]", body))
-        return kws
+        m = _EXPECTED_KWARGS_RE.search(src)
+        kws = set(_QUOTED_NAME_RE.findall(m.group(1))) if m else set()
     except Exception:
         return None
+    _EXPECTED_KWARGS_CACHE[func] = kws
+    return kws
 
 
 def _docstring_mentions_pagination(method: Callable[..., Any]) -> bool:
@@ -388,7 +632,7 @@ def _docstring_mentions_pagination(method: Callable[..., Any]) -> bool:
     except Exception:
         return False
     # look for common Sphinx/ReST patterns or plain mentions of parameter names
-    return bool(re.search(r"\b(page|limit)\b", doc))
+    return _PAGINATION_PARAM_RE.search(doc) is not None
 
 
 def _supports_pagination(method: Callable[..., Any], operation_name: str) -> bool:
@@ -419,9 +663,8 @@ def _supports_pagination(method: Callable[..., Any], operation_name: str) -> boo
         except Exception:
             pass
 
-        sig = inspect.signature(method)
-        param_names = set(sig.parameters.keys())
-        if "page" in param_names or "limit" in param_names:
+        signature = _signature_params(method)
+        if signature is not None and ("page" in signature[0] or "limit" in signature[0]):
             return True
     except Exception:
         # if we cannot introspect, fall through to explicit allowlist
@@ -430,22 +673,51 @@ def _supports_pagination(method: Callable[..., Any], operation_name: str) -> boo
     return operation_name in known_paginated
 
 
+def _response_header(response: Any, name: str) -> Optional[str]:
+    try:
+        return response.headers.get(name)
+    except Exception:
+        return None
+
+
+def _paginator_params(method: Callable[..., Any], params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    The OCI paginator already retries every page with oci.retry.DEFAULT_RETRY_STRATEGY, so
+    switch off the client's own retry strategy for those calls rather than stacking the two.
+    """
+    owner = getattr(method, "__self__", None)
+    if owner is None or not type(owner).__module__.startswith("oci.") or "retry_strategy" in params:
+        return params
+    return {**params, "retry_strategy": oci.retry.NoneRetryStrategy()}
+
+
 def _call_with_pagination_if_applicable(
     method: Callable[..., Any], params: Dict[str, Any], operation_name: str
-) -> Tuple[Any, Optional[str]]:
+) -> Tuple[Any, Optional[str], Optional[str]]:
     """
     If the operation appears to be paginated, use the OCI paginator to get all results.
-    Returns (data, opc_request_id).
+    When the caller passes a 'limit', it is pushed down to the service and paging stops
+    once that many records have been fetched. When the caller passes a 'page' token,
+    only that page is fetched, so results can be walked with the returned next page token.
+    Returns (data, opc_request_id, next_page).
     """
     if _supports_pagination(method, operation_name):
-        logger.info(f"Using paginator for operation {operation_name}")
-        response = oci.pagination.list_call_get_all_results(method, **params)
-        opc_request_id = None
-        try:
-            opc_request_id = response.headers.get("opc-request-id")
-        except Exception:
-            opc_request_id = None
-        return response.data, opc_request_id
+        limit = params.get("limit")
+        if params.get("page"):
+            logger.info(f"Fetching a single page for operation {operation_name}")
+            response = method(**params)
+        elif isinstance(limit, int) and not isinstance(limit, bool) and limit > 0:
+            logger.info(f"Using paginator for operation {operation_name} with limit {limit}")
+            remaining = _paginator_params(method, {k: v for k, v in params.items() if k != "limit"})
+            response = oci.pagination.list_call_get_up_to_limit(method, limit, limit, **remaining)
+        else:
+            logger.info(f"Using paginator for operation {operation_name}")
+            response = oci.pagination.list_call_get_all_results(method, **_paginator_params(method, params))
+        return (
+            response.data,
+            _response_header(response, "opc-request-id"),
+            _response_header(response, "opc-next-page"),
+        )
 
     # non-list operation; pre-alias known kwarg patterns and invoke, with fallback aliasing
     call_params = dict(params)
@@ -488,12 +760,11 @@ def _call_with_pagination_if_applicable(
         data = response.data
     else:
         data = response
-    opc_request_id = None
-    try:
-        opc_request_id = response.headers.get("opc-request-id")
-    except Exception:
-        opc_request_id = None
-    return data, opc_request_id
+    return (
+        data,
+        _response_header(response, "opc-request-id"),
+        _response_header(response, "opc-next-page"),
+    )
 
 
 @mcp.tool(description="Invoke an OCI Python SDK API via client and operation name.")
@@ -536,10 +807,13 @@ def invoke_oci_api(
         final_params = dict(coerced_params)
 
         final_params = _align_params_to_signature(method, operation, final_params)
+        _check_required_params(method, operation, final_params)
         logger.debug(f"invoke_oci_api final_params keys: {list(final_params.keys())}")
         logger.debug(f"op: {operation}")
         try:
-            data, opc_request_id = _call_with_pagination_if_applicable(method, final_params, operation)
+            data, opc_request_id, next_page = _call_with_pagination_if_applicable(
+                method, final_params, operation
+            )
         except TypeError as e:
             msg = str(e)
             if "unexpected keyword argument" in msg and (
@@ -552,7 +826,9 @@ def invoke_oci_api(
                 if src in final_params and dst not in final_params:
                     alt_params = dict(final_params)
                     alt_params[dst] = alt_params.pop(src)
-                    data, opc_request_id = _call_with_pagination_if_applicable(method, alt_params, operation)
+                    data, opc_request_id, next_page = _call_with_pagination_if_applicable(
+                        method, alt_params, operation
+                    )
                 else:
                     raise
             else:
@@ -565,6 +841,9 @@ def invoke_oci_api(
             "opc_request_id": opc_request_id,
             "data": _serialize_oci_data(data),
         }
+        if next_page:
+            # pass back as params['page'] to fetch the following page
+            result["next_page"] = next_page
         logger.info(
             f"invoke_oci_api success: client={client_fqn} op={operation} opc_request_id={opc_request_id}"
         )
@@ -0,0 +1,26 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import pytest
+from oracle.oci_cloud_mcp_server import server
+
+_CACHES = (
+    server._CONFIG_CACHE,
+    server._SIGNER_CACHE,
+    server._CLIENT_CACHE,
+    server._EXPECTED_KWARGS_CACHE,
+    server._SIGNATURE_CACHE,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_server_caches():
+    # module-level caches must not leak state between tests
+    for cache in _CACHES:
+        cache.clear()
+    yield
+    for cache in _CACHES:
+        cache.clear()
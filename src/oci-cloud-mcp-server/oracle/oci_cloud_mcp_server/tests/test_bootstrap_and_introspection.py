@@ -1,12 +1,15 @@
 from io import StringIO
 from types import SimpleNamespace
+from unittest.mock import MagicMock
 
+import oci
 import pytest
 from oracle.oci_cloud_mcp_server.server import (
     _align_params_to_signature,
     _extract_expected_kwargs_from_source,
     _get_config_and_signer,
     _import_client,
+    _load_config,
 )
 
 
@@ -132,6 +135,86 @@ class TestGetConfigAndSigner:
             _get_config_and_signer()
 
 
+class TestLoadConfig:
+    @staticmethod
+    def _write_config(path, tenancy):
+        key_file = path.parent / "key.pem"
+        key_file.touch()
+        path.write_text(
+            f"[DEFAULT]\nuser=u\nfingerprint=f\ntenancy={tenancy}\nregion=us-ashburn-1\nkey_file={key_file}\n"
+        )
+
+    def test_reuses_parsed_config_until_file_changes(self, monkeypatch, tmp_path):
+        import os
+
+        import oci
+
+        config_file = tmp_path / "config"
+        self._write_config(config_file, "t1")
+        monkeypatch.setenv("OCI_CONFIG_FILE", str(config_file))
+        monkeypatch.delenv("OCI_CONFIG_PROFILE", raising=False)
+
+        calls = []
+        real_from_file = oci.config.from_file
+
+        def counting_from_file(**kwargs):
+            calls.append(kwargs)
+            return real_from_file(**kwargs)
+
+        monkeypatch.setattr(
+            "oracle.oci_cloud_mcp_server.server.oci.config.from_file",
+            counting_from_file,
+        )
+
+        first = _load_config()
+        first["additional_user_agent"] = "mutated"
+        second = _load_config()
+        assert len(calls) == 1
+        assert second["tenancy"] == "t1"
+        # callers get their own copy
+        assert second.get("additional_user_agent") != "mutated"
+
+        self._write_config(config_file, "t2")
+        st = config_file.stat()
+        os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        third = _load_config()
+        assert len(calls) == 2
+        assert third["tenancy"] == "t2"
+
+    def test_cache_is_keyed_by_profile(self, monkeypatch, tmp_path):
+        key_file = tmp_path / "key.pem"
+        key_file.touch()
+        config_file = tmp_path / "config"
+        config_file.write_text(
+            f"[DEFAULT]\nuser=u\nfingerprint=f\ntenancy=t-default\nregion=r\nkey_file={key_file}\n"
+            f"[OTHER]\nuser=u\nfingerprint=f\ntenancy=t-other\nregion=r\nkey_file={key_file}\n"
+        )
+        monkeypatch.setenv("OCI_CONFIG_FILE", str(config_file))
+
+        monkeypatch.setenv("OCI_CONFIG_PROFILE", "DEFAULT")
+        assert _load_config()["tenancy"] == "t-default"
+        monkeypatch.setenv("OCI_CONFIG_PROFILE", "OTHER")
+        assert _load_config()["tenancy"] == "t-other"
+
+    def test_missing_config_file_is_not_cached(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("OCI_CONFIG_FILE", str(tmp_path / "missing"))
+        calls = []
+
+        def fake_from_file(**kwargs):
+            calls.append(kwargs)
+            return {"tenancy": "t"}
+
+        monkeypatch.setattr(
+            "oracle.oci_cloud_mcp_server.server.oci.config.from_file",
+            fake_from_file,
+        )
+
+        _load_config()
+        _load_config()
+        assert len(calls) == 2
+
+
 class TestAlignParamsToSignatureIntrospectionFailure:
     def test_returns_original_when_signature_raises(self, monkeypatch):
         def create_vcn(vcn_details):  # noqa: ARG001
@@ -191,6 +274,146 @@ class TestImportClientValidation:
             _import_client("x.y.NotClass")
 
 
+class TestSignerAndClientReuse:
+    @staticmethod
+    def _setup_session_auth(monkeypatch, tmp_path):
+        key_file = tmp_path / "key.pem"
+        key_file.touch()
+        token_file = tmp_path / "token"
+        token_file.write_text("token-1")
+        config_file = tmp_path / "config"
+        config_file.write_text(
+            f"[DEFAULT]\nfingerprint=f\ntenancy=t\nregion=r\nkey_file={key_file}\n"
+            f"security_token_file={token_file}\n"
+        )
+        monkeypatch.setenv("OCI_CONFIG_FILE", str(config_file))
+        monkeypatch.delenv("OCI_CONFIG_PROFILE", raising=False)
+        monkeypatch.setattr(
+            "oracle.oci_cloud_mcp_server.server.oci.signer.load_private_key_from_file",
+            lambda p: "PK",
+        )
+
+        class FakeSTS:
+            def __init__(self, token, private_key):
+                self.token = token
+                self.private_key = private_key
+
+        monkeypatch.setattr(
+            "oracle.oci_cloud_mcp_server.server.oci.auth.signers.SecurityTokenSigner",
+            FakeSTS,
+        )
+        return token_file
+
+    def test_signer_reused_until_token_file_changes(self, monkeypatch, tmp_path):
+        import os
+
+        token_file = self._setup_session_auth(monkeypatch, tmp_path)
+
+        _, first = _get_config_and_signer()
+        _, second = _get_config_and_signer()
+        assert first is second
+        assert first.token == "token-1"
+
+        token_file.write_text("token-2")
+        st = token_file.stat()
+        os.utime(token_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        _, third = _get_config_and_signer()
+        assert third is not first
+        assert third.token == "token-2"
+
+    def test_import_client_reuses_instance_for_same_signer(self, monkeypatch):
+        class GoodClient:
+            created = 0
+
+            def __init__(self, config, signer):
+                GoodClient.created += 1
+                self.signer = signer
+
+        fake_mod = SimpleNamespace(GoodClient=GoodClient)
+        monkeypatch.setattr("oracle.oci_cloud_mcp_server.server.import_module", lambda name: fake_mod)
+
+        signer = object()
+        monkeypatch.setattr(
+            "oracle.oci_cloud_mcp_server.server._get_config_and_signer",
+            lambda: ({}, signer),
+        )
+        first = _import_client("x.y.GoodClient")
+        second = _import_client("x.y.GoodClient")
+        assert first is second
+        assert GoodClient.created == 1
+
+        # a refreshed signer must produce a new client
+        new_signer = object()
+        monkeypatch.setattr(
+            "oracle.oci_cloud_mcp_server.server._get_config_and_signer",
+            lambda: ({}, new_signer),
+        )
+        third = _import_client("x.y.GoodClient")
+        assert third is not first
+        assert third.signer is new_signer
+        assert GoodClient.created == 2
+
+    def test_sdk_clients_get_shared_retry_strategy(self, monkeypatch):
+        from oracle.oci_cloud_mcp_server import server
+
+        monkeypatch.setattr(
+            "oracle.oci_cloud_mcp_server.server._get_config_and_signer",
+            lambda: ({"region": "us-ashburn-1"}, MagicMock(spec=oci.auth.signers.SecurityTokenSigner)),
+        )
+        client = _import_client("oci.identity.IdentityClient")
+        assert client.retry_strategy is server._RETRY_STRATEGY
+
+    def test_close_cached_clients_closes_sessions(self, monkeypatch):
+        from oracle.oci_cloud_mcp_server import server
+
+        closed = []
+        session = SimpleNamespace(close=lambda: closed.append(True))
+
+        class SessionClient:
+            def __init__(self, config, signer):
+                self.base_client = SimpleNamespace(session=session)
+
+        fake_mod = SimpleNamespace(SessionClient=SessionClient)
+        monkeypatch.setattr("oracle.oci_cloud_mcp_server.server.import_module", lambda name: fake_mod)
+        monkeypatch.setattr(
+            "oracle.oci_cloud_mcp_server.server._get_config_and_signer",
+            lambda: ({}, "signer"),
+        )
+
+        _import_client("x.y.SessionClient")
+        server._close_cached_clients()
+        assert closed == [True]
+        assert server._CLIENT_CACHE == {}
+
+    def test_replaced_client_session_is_closed(self, monkeypatch):
+        closed = []
+
+        class SessionClient:
+            def __init__(self, config, signer):
+                self.base_client = SimpleNamespace(
+                    session=SimpleNamespace(close=lambda: closed.append(signer))
+                )
+
+        fake_mod = SimpleNamespace(SessionClient=SessionClient)
+        monkeypatch.setattr("oracle.oci_cloud_mcp_server.server.import_module", lambda name: fake_mod)
+        monkeypatch.setattr(
+            "oracle.oci_cloud_mcp_server.server._get_config_and_signer",
+            lambda: ({}, "old-signer"),
+        )
+        _import_client("x.y.SessionClient")
+        _import_client("x.y.SessionClient")
+        assert closed == []
+
+        # a refreshed signer replaces the client and closes the old one's session
+        monkeypatch.setattr(
+            "oracle.oci_cloud_mcp_server.server._get_config_and_signer",
+            lambda: ({}, "new-signer"),
+        )
+        _import_client("x.y.SessionClient")
+        assert closed == ["old-signer"]
+
+
 class TestExtractExpectedKwargs:
     def test_extracts_expected_kwargs_from_source(self):
         def fn(**kwargs):  # noqa: ARG001
@@ -209,6 +432,25 @@ class TestExtractExpectedKwargs:
         assert isinstance(out, set)
         assert out == set()
 
+    def test_result_is_cached_per_function(self, monkeypatch):
+        class Client:
+            def get_thing(self, **kwargs):  # noqa: ARG002
+                expected_kwargs = ["page"]  # noqa: F841
+
+        from oracle.oci_cloud_mcp_server import server
+
+        calls = []
+        real_getsource = server.inspect.getsource
+
+        def counting_getsource(obj):
+            calls.append(obj)
+            return real_getsource(obj)
+
+        monkeypatch.setattr("oracle.oci_cloud_mcp_server.server.inspect.getsource", counting_getsource)
+        assert _extract_expected_kwargs_from_source(Client().get_thing) == {"page"}
+        assert _extract_expected_kwargs_from_source(Client().get_thing) == {"page"}
+        assert len(calls) == 1
+
     def test_returns_none_when_getsource_raises(self, monkeypatch):
         def boom(obj):
             raise Exception("no src")
@@ -380,7 +380,7 @@ class TestPreAliasCreatePath:
         def create_vcn(create_vcn_details):  # noqa: ARG001
             return Resp({"ok": True})
 
-        data, opc = _call_with_pagination_if_applicable(
+        data, opc, _ = _call_with_pagination_if_applicable(
             create_vcn,
             {"vcn_details": {"x": 1}},
             "create_vcn",
@@ -680,7 +680,7 @@ class TestListPaginatorHeadersMissing:
         def list_things():
             return Resp([9])
 
-        data, opc = _call_with_pagination_if_applicable(list_things, {}, "list_things")
+        data, opc, _ = _call_with_pagination_if_applicable(list_things, {}, "list_things")
         assert data == [1, 2]
         assert opc is None
 
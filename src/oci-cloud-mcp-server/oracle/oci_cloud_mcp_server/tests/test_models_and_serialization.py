@@ -1,5 +1,7 @@
+import datetime
 from types import SimpleNamespace
 
+import oci
 from oracle.oci_cloud_mcp_server.server import (
     _import_models_module_from_client_fqn,
     _resolve_model_class,
@@ -71,3 +73,26 @@ class TestSerializeOciData:
         # should be stringified
         assert isinstance(out, str)
         assert "P" in out
+
+    def test_sdk_models_match_oci_to_dict(self):
+        models = [
+            oci.core.models.Instance(
+                id=f"ocid1.instance..{i}",
+                time_created=datetime.datetime(2024, 1, 1, 12, 0, 0),
+                freeform_tags={"k": "v"},
+                shape_config=oci.core.models.InstanceShapeConfig(ocpus=2.0),
+            )
+            for i in range(3)
+        ]
+        out = _serialize_oci_data(models)
+        assert out == oci.util.to_dict(models)
+        assert out[0]["time_created"] == "2024-01-01T12:00:00+00:00"
+        assert out[0]["shape_config"]["ocpus"] == 2.0
+
+    def test_model_with_missing_attribute_skips_it(self):
+        class M:
+            def __init__(self):
+                self.swagger_types = {"a": "str", "b": "str"}
+                self.a = "x"
+
+        assert _serialize_oci_data(M()) == {"a": "x"}
@@ -1,8 +1,11 @@
 from types import SimpleNamespace
+from unittest.mock import MagicMock
 
+import oci
 import pytest
 from fastmcp import Client
 from oracle.oci_cloud_mcp_server.server import (
+    _RETRY_STRATEGY,
     _call_with_pagination_if_applicable,
     _import_client,
     _supports_pagination,
@@ -144,11 +147,119 @@ class TestPaginatorHeadersWithGet:
         def list_things():
             return Resp([9])
 
-        data, opc = _call_with_pagination_if_applicable(list_things, {}, "list_things")
+        data, opc, _ = _call_with_pagination_if_applicable(list_things, {}, "list_things")
         assert data == [1, 2, 3]
         assert opc == "req-123"
 
 
+class TestPaginatorRetries:
+    def test_sdk_client_retry_strategy_is_not_stacked_on_paginator(self, monkeypatch):
+        client = oci.identity.IdentityClient(
+            {"region": "us-ashburn-1"},
+            signer=MagicMock(spec=oci.auth.signers.SecurityTokenSigner),
+            retry_strategy=_RETRY_STRATEGY,
+        )
+        seen = {}
+
+        def fake_pager(method, **kwargs):  # noqa: ARG001
+            seen.update(kwargs)
+            return SimpleNamespace(data=[], headers={})
+
+        monkeypatch.setattr(
+            "oracle.oci_cloud_mcp_server.server.oci.pagination.list_call_get_all_results",
+            fake_pager,
+        )
+
+        _call_with_pagination_if_applicable(client.list_regions, {}, "list_regions")
+        assert isinstance(seen["retry_strategy"], oci.retry.NoneRetryStrategy)
+
+
+class TestPaginatorLimitPushdown:
+    @staticmethod
+    def _paged_list_things(total, calls):
+        class Resp:
+            def __init__(self, data, next_page):
+                self.status = 200
+                self.request = None
+                self.data = data
+                self.headers = {"opc-request-id": f"req-{len(calls)}"}
+                if next_page is not None:
+                    self.headers["opc-next-page"] = next_page
+                self.next_page = next_page
+                self.has_next_page = next_page is not None
+
+        def list_things(limit=None, page=None):
+            calls.append({"limit": limit, "page": page})
+            start = int(page or 0)
+            end = min(start + (limit or total), total)
+            return Resp(list(range(start, end)), str(end) if end < total else None)
+
+        return list_things
+
+    def test_limit_stops_paging_once_satisfied(self):
+        calls = []
+        list_things = self._paged_list_things(100, calls)
+
+        data, opc, next_page = _call_with_pagination_if_applicable(list_things, {"limit": 5}, "list_things")
+        assert data == [0, 1, 2, 3, 4]
+        assert calls == [{"limit": 5, "page": None}]
+        assert opc == "req-1"
+        assert next_page == "5"
+
+    def test_without_limit_fetches_all_pages(self):
+        calls = []
+        list_things = self._paged_list_things(5, calls)
+
+        data, _, next_page = _call_with_pagination_if_applicable(list_things, {}, "list_things")
+        assert data == [0, 1, 2, 3, 4]
+        assert len(calls) == 1
+        assert next_page is None
+
+    def test_page_token_fetches_only_that_page(self):
+        calls = []
+        list_things = self._paged_list_things(100, calls)
+
+        data, _, next_page = _call_with_pagination_if_applicable(
+            list_things, {"limit": 5, "page": "5"}, "list_things"
+        )
+        assert data == [5, 6, 7, 8, 9]
+        assert calls == [{"limit": 5, "page": "5"}]
+        assert next_page == "10"
+
+    @pytest.mark.asyncio
+    async def test_invoke_returns_next_page_token(self, monkeypatch):
+        calls = []
+        list_things = self._paged_list_things(100, calls)
+
+        class FakeClient:
+            def __init__(self, config, signer):  # noqa: ARG002
+                self.list_things = list_things
+
+        monkeypatch.setattr(
+            "oracle.oci_cloud_mcp_server.server.import_module",
+            lambda name: SimpleNamespace(FakeClient=FakeClient),
+        )
+        monkeypatch.setattr(
+            "oracle.oci_cloud_mcp_server.server._get_config_and_signer",
+            lambda: ({}, object()),
+        )
+
+        async with Client(mcp) as client:
+            res = (
+                await client.call_tool(
+                    "invoke_oci_api",
+                    {
+                        "client_fqn": "x.y.FakeClient",
+                        "operation": "list_things",
+                        "params": {"limit": 3},
+                    },
+                )
+            ).data
+
+        assert res["data"] == [0, 1, 2]
+        assert res["next_page"] == "3"
+
+
 class TestCallWithPaginationTypeErrorFallback:
     def test_typeerror_fallback_moves_src_to_dst(self):
         # when both 'vcn_details' (src) and 'create_vcn_details' (dst) are present,
@@ -163,7 +274,7 @@ class TestCallWithPaginationTypeErrorFallback:
             return Resp({"ok": True})
 
         # include both src and dst to force the TypeError path first, then fallback retry
-        data, opc = _call_with_pagination_if_applicable(
+        data, opc, _ = _call_with_pagination_if_applicable(
             create_vcn,
             {"vcn_details": {"x": 1}, "create_vcn_details": {"x": 1}},
             "create_vcn",
@@ -231,3 +342,41 @@ class TestInvokeTypeErrorPropagation:
 
         assert "error" in res
         assert "unexpected keyword" in res["error"].lower()
+
+
+class TestInvokeMissingRequiredParams:
+    @pytest.mark.asyncio
+    async def test_missing_required_params_are_reported_before_the_call(self, monkeypatch):
+        calls = []
+
+        class FakeClient:
+            def __init__(self, config, signer):  # noqa: ARG002
+                pass
+
+            def get_instance(self, instance_id, compartment_id, **kwargs):  # noqa: ARG002
+                calls.append(instance_id)
+                return {"ok": True}
+
+        monkeypatch.setattr(
+            "oracle.oci_cloud_mcp_server.server.import_module",
+            lambda name: SimpleNamespace(FakeClient=FakeClient),
+        )
+        monkeypatch.setattr(
+            "oracle.oci_cloud_mcp_server.server._get_config_and_signer",
+            lambda: ({}, object()),
+        )
+
+        async with Client(mcp) as client:
+            res = (
+                await client.call_tool(
+                    "invoke_oci_api",
+                    {
+                        "client_fqn": "x.y.FakeClient",
+                        "operation": "get_instance",
+                        "params": {"opc_request_id": "abc"},
+                    },
+                )
+            ).data
+
+        assert calls == []
+        assert res["error"] == "Missing required parameters for 'get_instance': instance_id, compartment_id"
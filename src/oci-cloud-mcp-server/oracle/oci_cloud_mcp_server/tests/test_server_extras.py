@@ -445,7 +445,7 @@ class TestCallWithPaginationFallback:
         def create_vcn(create_vcn_details):  # noqa: ARG001
             return FakeResponse()
 
-        data, opc = __import__(
+        data, opc, _ = __import__(
             "oracle.oci_cloud_mcp_server.server",
             fromlist=["_call_with_pagination_if_applicable"],
         )._call_with_pagination_if_applicable(create_vcn, {"vcn_details": {}}, "create_vcn")
@@ -732,7 +732,7 @@ class TestCallWithPaginationHeadersError:
         def fn_ok():
             return Resp()
 
-        data, opc = _call_with_pagination_if_applicable(lambda: fn_ok(), {}, "get_thing")
+        data, opc, _ = _call_with_pagination_if_applicable(lambda: fn_ok(), {}, "get_thing")
         assert data == {"val": 1}
         assert opc is None
 
@@ -923,7 +923,7 @@ class TestPaginationListPath:
         def list_things(compartment_id=None):  # noqa: ARG001
             return Resp([{"n": 9}])
 
-        data, opc = _call_with_pagination_if_applicable(
+        data, opc, _ = _call_with_pagination_if_applicable(
             list_things, {"compartment_id": "ocid1"}, "list_things"
         )
         assert isinstance(data, list) and len(data) == 2
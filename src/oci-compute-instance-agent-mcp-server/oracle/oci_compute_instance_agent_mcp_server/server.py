@@ -32,6 +32,14 @@ logger = Logger(__name__, level="INFO")
 
 mcp = FastMCP(name=__project__)
 
+# A command execution in any of these states will not change again, so polling stops there
+FINISHED_COMMAND_EXECUTION_STATES = (
+    oci.compute_instance_agent.models.InstanceAgentCommandExecution.LIFECYCLE_STATE_SUCCEEDED,
+    oci.compute_instance_agent.models.InstanceAgentCommandExecution.LIFECYCLE_STATE_FAILED,
+    oci.compute_instance_agent.models.InstanceAgentCommandExecution.LIFECYCLE_STATE_TIMED_OUT,
+    oci.compute_instance_agent.models.InstanceAgentCommandExecution.LIFECYCLE_STATE_CANCELED,
+)
+
 
 def get_compute_instance_agent_client():
     logger.info("entering get_compute_instance_agent_client")
@@ -104,7 +112,7 @@ def run_instance_agent_command(
             client=client,
             response=execution_response,
             property="lifecycle_state",
-            state=oci.compute_instance_agent.models.InstanceAgentCommandExecution.LIFECYCLE_STATE_SUCCEEDED,
+            state=FINISHED_COMMAND_EXECUTION_STATES,
             max_interval_seconds=5,
             max_wait_seconds=240,
         )
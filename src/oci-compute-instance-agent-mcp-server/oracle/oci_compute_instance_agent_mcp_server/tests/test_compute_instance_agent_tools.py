@@ -94,11 +94,16 @@ class TestComputeInstanceAgent:
             assert result["instance_id"] == "test_instance"
             assert result["content"]["text"] == "Hello"
 
-        # Verify we waited for SUCCEEDED lifecycle state
+        # Verify we waited until the execution finished, successfully or not
         mock_wait_until.assert_called()
         args, kwargs = mock_wait_until.call_args
         assert kwargs["property"] == "lifecycle_state"
-        assert kwargs["state"] == InstanceAgentCommandExecution.LIFECYCLE_STATE_SUCCEEDED
+        assert kwargs["state"] == (
+            InstanceAgentCommandExecution.LIFECYCLE_STATE_SUCCEEDED,
+            InstanceAgentCommandExecution.LIFECYCLE_STATE_FAILED,
+            InstanceAgentCommandExecution.LIFECYCLE_STATE_TIMED_OUT,
+            InstanceAgentCommandExecution.LIFECYCLE_STATE_CANCELED,
+        )
 
     @pytest.mark.asyncio
     @patch("oracle.oci_compute_instance_agent_mcp_server.server.get_compute_instance_agent_client")
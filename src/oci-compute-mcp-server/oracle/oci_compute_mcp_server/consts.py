@@ -6,5 +6,7 @@ https://oss.oracle.com/licenses/upl.
 
 ORACLE_LINUX_9_IMAGE = "ocid1.image.oc1.iad.aaaaaaaa4l64brs5udx52nedrhlex4cpaorcd2jwvpoududksmw4lgmameqq"
 E5_FLEX = "VM.Standard.E5.Flex"
+# Every flexible shape name ends with this, and only flexible shapes accept a shape config
+FLEX_SHAPE_SUFFIX = ".Flex"
 DEFAULT_OCPU_COUNT = 1
 DEFAULT_MEMORY_IN_GBS = 12
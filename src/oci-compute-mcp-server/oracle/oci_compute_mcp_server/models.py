@@ -5,6 +5,7 @@ https://oss.oracle.com/licenses/upl.
 """
 
 from datetime import datetime
+from operator import attrgetter
 from typing import Any, Dict, List, Literal, Optional
 
 import oci
@@ -13,10 +14,43 @@ from pydantic import BaseModel, Field
 # Nested OCI models represented as Pydantic classes
 
 
+# Attribute names of each OCI model class, read once from swagger_types
+_MODEL_FIELDS: Dict[type, tuple[str, ...]] = {}
+_PLAIN_VALUE_TYPES = (str, bool, int, float, type(None))
+_MISSING = object()
+
+
+def _project_model(obj) -> Dict[str, Any]:
+    """
+    Same result as oci.util.to_dict for an OCI model, but with its field names
+    memoized per class and scalar attributes copied without recursing into to_dict.
+    """
+    from oci.util import to_dict as oci_to_dict
+
+    cls = type(obj)
+    fields = _MODEL_FIELDS.get(cls)
+    if fields is None:
+        fields = tuple(obj.swagger_types)
+        if cls.__module__.startswith("oci."):
+            _MODEL_FIELDS[cls] = fields
+    data = {}
+    for field in fields:
+        value = getattr(obj, field, _MISSING)
+        if value is _MISSING:
+            continue
+        data[field] = value if isinstance(value, _PLAIN_VALUE_TYPES) else oci_to_dict(value)
+    return data
+
+
 def _oci_to_dict(obj):
     """Best-effort conversion of OCI SDK model objects to plain dicts."""
     if obj is None:
         return None
+    if isinstance(getattr(obj, "swagger_types", None), dict):
+        try:
+            return _project_model(obj)
+        except Exception:
+            pass
     try:
         from oci.util import to_dict as oci_to_dict
 
@@ -30,6 +64,17 @@ def _oci_to_dict(obj):
     return None
 
 
+def _read_fields(obj, fields: tuple[str, ...], getter: attrgetter) -> Dict[str, Any]:
+    """
+    Read the given attributes of obj into a dict with a single attrgetter call.
+    Falls back to per-attribute getattr defaults when obj lacks one of them.
+    """
+    try:
+        return dict(zip(fields, getter(obj)))
+    except AttributeError:
+        return {field: getattr(obj, field, None) for field in fields}
+
+
 # region Instance
 
 
@@ -365,15 +410,47 @@ def map_platform_config(pc) -> PlatformConfig | None:
 def map_licensing_configs(items) -> list[LicensingConfig] | None:
     if not items:
         return None
-    result: list[LicensingConfig] = []
-    for it in items:
-        data = _oci_to_dict(it) or {}
-        result.append(
-            LicensingConfig(
-                license_type=getattr(it, "license_type", None) or data.get("license_type"),
-            )
+    # Only license_type is read, so pull it straight off each item rather than
+    # walking the whole model with to_dict
+    return [
+        LicensingConfig(
+            license_type=(
+                it.get("license_type") if isinstance(it, dict) else getattr(it, "license_type", None)
+            ),
         )
-    return result
+        for it in items
+    ]
+
+
+# Plain attributes copied as-is by map_instance; nested models are mapped separately
+_INSTANCE_FIELDS = (
+    "availability_domain",
+    "capacity_reservation_id",
+    "compartment_id",
+    "cluster_placement_group_id",
+    "dedicated_vm_host_id",
+    "defined_tags",
+    "security_attributes",
+    "security_attributes_state",
+    "display_name",
+    "extended_metadata",
+    "fault_domain",
+    "freeform_tags",
+    "id",
+    "image_id",
+    "ipxe_script",
+    "launch_mode",
+    "lifecycle_state",
+    "metadata",
+    "region",
+    "shape",
+    "is_cross_numa_node",
+    "system_tags",
+    "time_created",
+    "time_maintenance_reboot_due",
+    "instance_configuration_id",
+)
+_get_instance_fields = attrgetter(*_INSTANCE_FIELDS)
 
 
 def map_instance(
@@ -383,47 +460,44 @@ def map_instance(
     Convert an oci.core.models.Instance to oracle.oci_compute_mcp_server.Instance,
     including all nested types.
     """
-    return Instance(
-        availability_domain=getattr(instance_data, "availability_domain", None),
-        capacity_reservation_id=getattr(instance_data, "capacity_reservation_id", None),
-        compartment_id=getattr(instance_data, "compartment_id", None),
+    fields = _read_fields(instance_data, _INSTANCE_FIELDS, _get_instance_fields)
+    fields.update(
         placement_constraint_details=map_placement_constraint_details(
             getattr(instance_data, "placement_constraint_details", None)
         ),
-        cluster_placement_group_id=getattr(instance_data, "cluster_placement_group_id", None),
-        dedicated_vm_host_id=getattr(instance_data, "dedicated_vm_host_id", None),
-        defined_tags=getattr(instance_data, "defined_tags", None),
-        security_attributes=getattr(instance_data, "security_attributes", None),
-        security_attributes_state=getattr(instance_data, "security_attributes_state", None),
-        display_name=getattr(instance_data, "display_name", None),
-        extended_metadata=getattr(instance_data, "extended_metadata", None),
-        fault_domain=getattr(instance_data, "fault_domain", None),
-        freeform_tags=getattr(instance_data, "freeform_tags", None),
-        id=getattr(instance_data, "id", None),
-        image_id=getattr(instance_data, "image_id", None),
-        ipxe_script=getattr(instance_data, "ipxe_script", None),
-        launch_mode=getattr(instance_data, "launch_mode", None),
         launch_options=map_launch_options(getattr(instance_data, "launch_options", None)),
         instance_options=map_instance_options(getattr(instance_data, "instance_options", None)),
         availability_config=map_availability_config(getattr(instance_data, "availability_config", None)),
         preemptible_instance_config=map_preemptible_config(
             getattr(instance_data, "preemptible_instance_config", None)
         ),
-        lifecycle_state=getattr(instance_data, "lifecycle_state", None),
-        metadata=getattr(instance_data, "metadata", None),
-        region=getattr(instance_data, "region", None),
-        shape=getattr(instance_data, "shape", None),
         shape_config=map_shape_config(getattr(instance_data, "shape_config", None)),
-        is_cross_numa_node=getattr(instance_data, "is_cross_numa_node", None),
         source_details=map_source_details(getattr(instance_data, "source_details", None)),
-        system_tags=getattr(instance_data, "system_tags", None),
-        time_created=getattr(instance_data, "time_created", None),
         agent_config=map_agent_config(getattr(instance_data, "agent_config", None)),
-        time_maintenance_reboot_due=getattr(instance_data, "time_maintenance_reboot_due", None),
         platform_config=map_platform_config(getattr(instance_data, "platform_config", None)),
-        instance_configuration_id=getattr(instance_data, "instance_configuration_id", None),
         licensing_configs=map_licensing_configs(getattr(instance_data, "licensing_configs", None)),
     )
+    return Instance.model_validate(fields)
+
+
+class InstanceActionFailure(BaseModel):
+    """An instance action that could not be performed."""
+
+    instance_id: str = Field(..., description="The OCID of the instance")
+    error: str = Field(..., description="Why the action failed on this instance.")
+
+
+class BatchInstanceActionResult(BaseModel):
+    """Outcome of performing one action on several instances."""
+
+    instances: List[Instance] = Field(
+        default_factory=list,
+        description="The instances the action was performed on, in request order.",
+    )
+    failures: List[InstanceActionFailure] = Field(
+        default_factory=list,
+        description="The instances the action failed on, in request order.",
+    )
 
 
 # endregion
@@ -4,21 +4,32 @@ Licensed under the Universal Permissive License v1.0 as shown at
 https://oss.oracle.com/licenses/upl.
 """
 
+import asyncio
+import atexit
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
 from logging import Logger
 from typing import Literal, Optional
 
 import oci
 from fastmcp import FastMCP
+from oci._vendor.requests.adapters import HTTPAdapter
 from oracle.oci_compute_mcp_server.consts import (
     DEFAULT_MEMORY_IN_GBS,
     DEFAULT_OCPU_COUNT,
     E5_FLEX,
+    FLEX_SHAPE_SUFFIX,
     ORACLE_LINUX_9_IMAGE,
 )
 from oracle.oci_compute_mcp_server.models import (
+    BatchInstanceActionResult,
     Image,
     Instance,
+    InstanceActionFailure,
     Response,
     VnicAttachment,
     map_image,
@@ -35,26 +46,125 @@ logger = Logger(__name__, level="INFO")
 mcp = FastMCP(name=__project__)
 
 
+DEFAULT_SDK_CONCURRENCY = 8
+
+
+def _sdk_concurrency() -> int:
+    value = os.getenv("OCI_MCP_CONCURRENCY")
+    if value is None:
+        return DEFAULT_SDK_CONCURRENCY
+    try:
+        concurrency = int(value)
+    except ValueError:
+        logger.warning(f"Ignoring invalid OCI_MCP_CONCURRENCY={value!r}, using {DEFAULT_SDK_CONCURRENCY}")
+        return DEFAULT_SDK_CONCURRENCY
+    # The worker pool and the connection pool both need at least one slot
+    return max(concurrency, 1)
+
+
+# Upper bound on SDK calls in flight at once across all tool invocations
+SDK_CONCURRENCY = _sdk_concurrency()
+SDK_TIMEOUT = (10, 60)  # (connect, read) seconds
+
+# Throttled (429) and transiently failing (500, 503) requests are retried inside the SDK,
+# with jittered exponential backoff, on the client's kept-alive connections
+SDK_RETRY_STRATEGY = oci.retry.RetryStrategyBuilder(
+    max_attempts_check=True,
+    max_attempts=3,
+    total_elapsed_time_check=True,
+    total_elapsed_time_seconds=30,
+    service_error_check=True,
+    service_error_retry_config={429: [], 500: [], 503: []},
+    service_error_retry_on_any_5xx=False,
+).get_retry_strategy()
+
+# Compute clients keyed by (config file, profile). A cached client is reused while its config
+# and its key and security token files are unchanged, so its HTTPS connection pool survives
+# across tool calls; a refreshed session token yields a new client.
+_compute_clients: dict[tuple[str, str], tuple[tuple, oci.core.ComputeClient]] = {}
+_compute_clients_lock = threading.Lock()
+
+
+def _config_key() -> tuple[str, str]:
+    return (
+        os.getenv("OCI_CONFIG_FILE", oci.config.DEFAULT_LOCATION),
+        os.getenv("OCI_CONFIG_PROFILE", oci.config.DEFAULT_PROFILE),
+    )
+
+
 def get_compute_client():
     logger.info("entering get_compute_client")
-    config = oci.config.from_file(
-        file_location=os.getenv("OCI_CONFIG_FILE", oci.config.DEFAULT_LOCATION),
-        profile_name=os.getenv("OCI_CONFIG_PROFILE", oci.config.DEFAULT_PROFILE),
-    )
+    config_file, profile = _config_key()
+    config = oci.config.from_file(file_location=config_file, profile_name=profile)
     user_agent_name = __project__.split("oracle.", 1)[1].split("-server", 1)[0]
     config["additional_user_agent"] = f"{user_agent_name}/{__version__}"
 
-    private_key = oci.signer.load_private_key_from_file(config["key_file"])
+    key_file = os.path.expanduser(config["key_file"])
     token_file = os.path.expanduser(config["security_token_file"])
-    token = None
-    with open(token_file, "r") as f:
-        token = f.read()
-    signer = oci.auth.signers.SecurityTokenSigner(token, private_key)
-    return oci.core.ComputeClient(config, signer=signer)
+    stamp = (
+        sorted(config.items()),
+        os.stat(key_file).st_mtime_ns,
+        os.stat(token_file).st_mtime_ns,
+    )
+    with _compute_clients_lock:
+        cached = _compute_clients.get((config_file, profile))
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        private_key = oci.signer.load_private_key_from_file(key_file)
+        token = None
+        with open(token_file, "r") as f:
+            token = f.read()
+        signer = oci.auth.signers.SecurityTokenSigner(token, private_key)
+        client = oci.core.ComputeClient(
+            config, signer=signer, timeout=SDK_TIMEOUT, retry_strategy=SDK_RETRY_STRATEGY
+        )
+        # Keep a kept-alive connection for every call that may be in flight at once, so
+        # concurrent tool calls don't discard connections and redo TLS handshakes
+        client.base_client.session.mount("https://", HTTPAdapter(pool_maxsize=SDK_CONCURRENCY))
+        _compute_clients[(config_file, profile)] = (stamp, client)
+        return client
+
+
+@atexit.register
+def _close_compute_clients():
+    with _compute_clients_lock:
+        for _, client in _compute_clients.values():
+            client.base_client.session.close()
+        _compute_clients.clear()
+
+
+# SDK calls get their own worker threads, one per pooled connection, rather than sharing the
+# event loop's small default executor with everything else that runs in a thread
+_sdk_executor = ThreadPoolExecutor(max_workers=SDK_CONCURRENCY, thread_name_prefix="oci-sdk")
+
+
+async def call_sdk(fn, /, *args, **kwargs):
+    """Run a blocking SDK call on the SDK worker threads so the event loop stays free."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_sdk_executor, partial(fn, *args, **kwargs))
+
+
+def iter_records(list_method, **kwargs):
+    """Yield the records of a paginated list call, fetching each page only once it is reached."""
+    while True:
+        response: oci.response.Response = list_method(**kwargs)
+        yield from response.data
+        if not response.has_next_page:
+            return
+        kwargs["page"] = response.next_page
+
+
+def list_records(list_method, limit: Optional[int] = None, **kwargs) -> list:
+    """
+    At most limit records of a paginated list call. No page past the one holding the
+    last wanted record is fetched, and limit also caps the page size.
+    """
+    return list(islice(iter_records(list_method, limit=limit, **kwargs), limit))
 
 
 @mcp.tool(description="List Instances in a given compartment")
-def list_instances(
+async def list_instances(
     compartment_id: str = Field(..., description="The OCID of the compartment"),
     limit: Optional[int] = Field(
         None,
@@ -75,62 +185,61 @@ def list_instances(
         ]
     ] = Field(None, description="The lifecycle state of the instance to filter on"),
 ) -> list[Instance]:
-    instances: list[Instance] = []
-
     try:
-        client = get_compute_client()
-
-        response: oci.response.Response = None
-        has_next_page = True
-        next_page: str = None
+        client = await asyncio.to_thread(get_compute_client)
 
-        while has_next_page and (limit is None or len(instances) < limit):
-            kwargs = {
-                "compartment_id": compartment_id,
-                "page": next_page,
-                "limit": limit,
-            }
+        kwargs = {"compartment_id": compartment_id}
+        if lifecycle_state:
+            kwargs["lifecycle_state"] = lifecycle_state
 
-            if lifecycle_state:
-                kwargs["lifecycle_state"] = lifecycle_state
-
-            response = client.list_instances(**kwargs)
-            has_next_page = response.has_next_page
-            next_page = response.next_page if hasattr(response, "next_page") else None
-
-            data: list[oci.core.models.Instance] = response.data
-            for d in data:
-                instance = map_instance(d)
-                instances.append(instance)
+        data: list[oci.core.models.Instance] = await call_sdk(
+            list_records, client.list_instances, limit, **kwargs
+        )
+        instances = [map_instance(d) for d in data]
 
         logger.info(f"Found {len(instances)} Instances")
         return instances
 
+    except oci.exceptions.ServiceError as e:
+        # Expected service errors (e.g. a wrong OCID) get a compact one-liner, not str(e)
+        logger.warning(f"OCI error in list_instances tool: status={e.status} code={e.code}")
+        raise e
     except Exception as e:
         logger.error(f"Error in list_instances tool: {str(e)}")
         raise e
 
 
 @mcp.tool(description="Get Instance with a given instance OCID")
-def get_instance(instance_id: str = Field(..., description="The OCID of the instance")) -> Instance:
+async def get_instance(instance_id: str = Field(..., description="The OCID of the instance")) -> Instance:
     try:
-        client = get_compute_client()
+        client = await asyncio.to_thread(get_compute_client)
 
-        response: oci.response.Response = client.get_instance(instance_id=instance_id)
+        response: oci.response.Response = await call_sdk(client.get_instance, instance_id=instance_id)
         data: oci.core.models.Instance = response.data
         logger.info("Found Instance")
         return map_instance(data)
 
+    except oci.exceptions.ServiceError as e:
+        logger.warning(f"OCI error in get_instance tool: status={e.status} code={e.code}")
+        raise e
     except Exception as e:
         logger.error(f"Error in get_instance tool: {str(e)}")
         raise e
 
 
+def launch_shape_config(ocpus: Optional[int], memory_in_gbs: Optional[float]):
+    """
+    Shape config for launching a flexible shape. SDK models are mutable, so every
+    launch gets its own rather than sharing one per size.
+    """
+    return oci.core.models.LaunchInstanceShapeConfigDetails(ocpus=ocpus, memory_in_gbs=memory_in_gbs)
+
+
 @mcp.tool(
     description="Create a new instance. "
     "Another word for instance could be compute, server, or virtual machine"
 )
-def launch_instance(
+async def launch_instance(
     compartment_id: str = Field(
         ...,
         description="This is the ocid of the compartment to create the instance in."
@@ -179,15 +288,16 @@ def launch_instance(
     ),
     ocpus: Optional[int] = Field(
         DEFAULT_OCPU_COUNT,
-        description="The total number of cores in the instances",
+        description="The total number of cores in the instances. Only used for flexible shapes",
     ),
     memory_in_gbs: Optional[float] = Field(
         DEFAULT_MEMORY_IN_GBS,
-        description="The total amount of memory in gigabytes to assigned to the instance",
+        description="The total amount of memory in gigabytes to assigned to the instance. "
+        "Only used for flexible shapes",
     ),
 ) -> Instance:
     try:
-        client = get_compute_client()
+        client = await asyncio.to_thread(get_compute_client)
 
         launch_details = oci.core.models.LaunchInstanceDetails(
             compartment_id=compartment_id,
@@ -198,37 +308,45 @@ def launch_instance(
                 image_id=image_id,
             ),
             create_vnic_details=oci.core.models.CreateVnicDetails(subnet_id=subnet_id),
-            shape_config=oci.core.models.LaunchInstanceShapeConfigDetails(
-                ocpus=ocpus, memory_in_gbs=memory_in_gbs
-            ),
         )
+        # Fixed shapes have a set core count and memory and reject a shape config
+        if shape.endswith(FLEX_SHAPE_SUFFIX):
+            launch_details.shape_config = launch_shape_config(ocpus, memory_in_gbs)
 
-        response: oci.response.Response = client.launch_instance(launch_details)
+        response: oci.response.Response = await call_sdk(client.launch_instance, launch_details)
         data: oci.core.models.Instance = response.data
         logger.info("Launched Instance")
         return map_instance(data)
 
+    except oci.exceptions.ServiceError as e:
+        logger.warning(f"OCI error in launch_instance tool: status={e.status} code={e.code}")
+        raise e
     except Exception as e:
         logger.error(f"Error in launch_instance tool: {str(e)}")
         raise e
 
 
 @mcp.tool(description="Delete instance with given instance OCID")
-def terminate_instance(instance_id: str = Field(..., description="The OCID of the instance")) -> Response:
+async def terminate_instance(
+    instance_id: str = Field(..., description="The OCID of the instance"),
+) -> Response:
     try:
-        client = get_compute_client()
+        client = await asyncio.to_thread(get_compute_client)
 
-        response: oci.response.Response = client.terminate_instance(instance_id)
+        response: oci.response.Response = await call_sdk(client.terminate_instance, instance_id)
         logger.info("Deleted Instance")
         return map_response(response)
 
+    except oci.exceptions.ServiceError as e:
+        logger.warning(f"OCI error in terminate_instance tool: status={e.status} code={e.code}")
+        raise e
     except Exception as e:
-        logger.error(f"Error in delete_vcn tool: {str(e)}")
+        logger.error(f"Error in terminate_instance tool: {str(e)}")
         raise e
 
 
 @mcp.tool(description="Update instance. This may restart the instance, so warn the user")
-def update_instance(
+async def update_instance(
     instance_id: str = Field(..., description="The OCID of the instance"),
     ocpus: Optional[int] = Field(
         None,
@@ -240,7 +358,7 @@ def update_instance(
     ),
 ) -> Instance:
     try:
-        client = get_compute_client()
+        client = await asyncio.to_thread(get_compute_client)
 
         update_instance_details = oci.core.models.UpdateInstanceDetails(
             shape_config=oci.core.models.UpdateInstanceShapeConfigDetails(
@@ -248,20 +366,23 @@ def update_instance(
             ),
         )
 
-        response: oci.response.Response = client.update_instance(
-            instance_id=instance_id, update_instance_details=update_instance_details
+        response: oci.response.Response = await call_sdk(
+            client.update_instance, instance_id=instance_id, update_instance_details=update_instance_details
         )
         data: oci.core.models.Instance = response.data
         logger.info("Updated Instance")
         return map_instance(data)
 
+    except oci.exceptions.ServiceError as e:
+        logger.warning(f"OCI error in update_instance tool: status={e.status} code={e.code}")
+        raise e
     except Exception as e:
         logger.error(f"Error in update_instance tool: {str(e)}")
         raise e
 
 
 @mcp.tool(description="List images in a given compartment, optionally filtered by operating system")
-def list_images(
+async def list_images(
     compartment_id: str = Field(..., description="The OCID of the compartment"),
     operating_system: Optional[str] = Field(None, description="The operating system to filter with"),
     limit: Optional[int] = Field(
@@ -270,59 +391,70 @@ def list_images(
         ge=1,
     ),
 ) -> list[Image]:
-    images: list[Image] = []
-
     try:
-        client = get_compute_client()
+        client = await asyncio.to_thread(get_compute_client)
 
-        response: oci.response.Response = None
-        has_next_page = True
-        next_page: str = None
-
-        while has_next_page and (limit is None or len(images) < limit):
-            kwargs = {
-                "compartment_id": compartment_id,
-                "page": next_page,
-                "limit": limit,
-            }
-
-            response = client.list_images(**kwargs)
-            has_next_page = response.has_next_page
-            next_page = response.next_page if hasattr(response, "next_page") else None
-
-            data: list[oci.core.models.Image] = response.data
-            if operating_system:
-                data = [img for img in data if img.operating_system == operating_system]
-
-            for d in data:
-                image = map_image(d)
-                images.append(image)
+        data: list[oci.core.models.Image] = await call_sdk(
+            list_records,
+            client.list_images,
+            limit,
+            compartment_id=compartment_id,
+            operating_system=operating_system,
+        )
+        images = [map_image(d) for d in data]
 
         logger.info(f"Found {len(images)} Images")
         return images
 
+    except oci.exceptions.ServiceError as e:
+        logger.warning(f"OCI error in list_images tool: status={e.status} code={e.code}")
+        raise e
     except Exception as e:
         logger.error(f"Error in list_images tool: {str(e)}")
         raise e
 
 
+# Available images keyed by (config file, profile, OCID) and stamped with time.monotonic().
+# Agents resolve the same image over and over (for instance before each launch); within
+# AVAILABLE_IMAGE_TTL seconds a repeated lookup is answered from here, so a profile only sees
+# images it fetched itself, and an image deleted or deprecated since is noticed soon after.
+_available_images: dict[tuple[str, str, str], tuple[float, Image]] = {}
+AVAILABLE_IMAGE_CACHE_SIZE = 256
+AVAILABLE_IMAGE_TTL = 300.0
+
+
 @mcp.tool(description="Get Image with a given image OCID")
-def get_image(image_id: str = Field(..., description="The OCID of the image")) -> Image:
+async def get_image(image_id: str = Field(..., description="The OCID of the image")) -> Image:
     try:
-        client = get_compute_client()
-
-        response: oci.response.Response = client.get_image(image_id=image_id)
+        # The client is resolved first, so a cached image is only served with valid credentials
+        client = await asyncio.to_thread(get_compute_client)
+        key = (*_config_key(), image_id)
+        cached = _available_images.get(key)
+        if cached is not None and time.monotonic() - cached[0] < AVAILABLE_IMAGE_TTL:
+            logger.info("Found Image")
+            return cached[1]
+
+        response: oci.response.Response = await call_sdk(client.get_image, image_id=image_id)
         data: oci.core.models.Image = response.data
         logger.info("Found Image")
-        return map_image(data)
-
+        image = map_image(data)
+        _available_images.pop(key, None)
+        if image.lifecycle_state == "AVAILABLE":
+            if len(_available_images) >= AVAILABLE_IMAGE_CACHE_SIZE:
+                del _available_images[next(iter(_available_images))]
+            _available_images[key] = (time.monotonic(), image)
+        return image
+
+    except oci.exceptions.ServiceError as e:
+        logger.warning(f"OCI error in get_image tool: status={e.status} code={e.code}")
+        raise e
     except Exception as e:
         logger.error(f"Error in get_image tool: {str(e)}")
         raise e
 
 
 @mcp.tool(description="Perform the desired action on a given instance")
-def instance_action(
+async def instance_action(
     instance_id: str = Field(..., description="The OCID of the instance"),
     action: Literal[
         "START",
@@ -336,20 +468,69 @@ def instance_action(
     ] = Field(..., description="The instance action to be performed"),
 ) -> Instance:
     try:
-        client = get_compute_client()
+        client = await asyncio.to_thread(get_compute_client)
 
-        response: oci.response.Response = client.instance_action(instance_id, action)
+        response: oci.response.Response = await call_sdk(client.instance_action, instance_id, action)
         data: oci.core.models.Instance = response.data
         logger.info("Performed instance action")
         return map_instance(data)
 
+    except oci.exceptions.ServiceError as e:
+        logger.warning(f"OCI error in instance_action tool: status={e.status} code={e.code}")
+        raise e
     except Exception as e:
         logger.error(f"Error in instance_action tool: {str(e)}")
         raise e
 
 
+@mcp.tool(
+    description="Perform the desired action on several instances at once. "
+    "Failures on some instances do not stop the action on the others"
+)
+async def batch_instance_action(
+    instance_ids: list[str] = Field(..., description="The OCIDs of the instances", min_length=1),
+    action: Literal[
+        "START",
+        "STOP",
+        "RESET",
+        "SOFTSTOP",
+        "SOFTRESET",
+        "SENDDIAGNOSTICINTERRUPT",
+        "DIAGNOSTICREBOOT",
+        "REBOOTMIGRATE",
+    ] = Field(..., description="The instance action to be performed"),
+) -> BatchInstanceActionResult:
+    try:
+        client = await asyncio.to_thread(get_compute_client)
+
+        # The actions are independent, so dispatch them together and let call_sdk bound concurrency
+        responses = await asyncio.gather(
+            *(call_sdk(client.instance_action, instance_id, action) for instance_id in instance_ids),
+            return_exceptions=True,
+        )
+
+        result = BatchInstanceActionResult()
+        for instance_id, response in zip(instance_ids, responses):
+            if isinstance(response, BaseException):
+                result.failures.append(InstanceActionFailure(instance_id=instance_id, error=str(response)))
+            else:
+                result.instances.append(map_instance(response.data))
+
+        logger.info(
+            f"Performed instance action on {len(result.instances)} Instances, {len(result.failures)} failed"
+        )
+        return result
+
+    except oci.exceptions.ServiceError as e:
+        logger.warning(f"OCI error in batch_instance_action tool: status={e.status} code={e.code}")
+        raise e
+    except Exception as e:
+        logger.error(f"Error in batch_instance_action tool: {str(e)}")
+        raise e
+
+
 @mcp.tool(description="List vnic attachments in a given compartment and/or on a given instance. ")
-def list_vnic_attachments(
+async def list_vnic_attachments(
     compartment_id: str = Field(
         ...,
         description="The OCID of the compartment. "
@@ -363,54 +544,46 @@ def list_vnic_attachments(
         ge=1,
     ),
 ) -> list[VnicAttachment]:
-    vnic_attachments: list[VnicAttachment] = []
-
     try:
-        client = get_compute_client()
-
-        response: oci.response.Response = None
-        has_next_page = True
-        next_page: str = None
-
-        while has_next_page and (limit is None or len(vnic_attachments) < limit):
-            kwargs = {
-                "compartment_id": compartment_id,
-                "page": next_page,
-                "limit": limit,
-            }
-
-            if instance_id:
-                kwargs["instance_id"] = instance_id
+        client = await asyncio.to_thread(get_compute_client)
 
-            response = client.list_vnic_attachments(**kwargs)
-            has_next_page = response.has_next_page
-            next_page = response.next_page if hasattr(response, "next_page") else None
+        kwargs = {"compartment_id": compartment_id}
+        if instance_id:
+            kwargs["instance_id"] = instance_id
 
-            data: list[oci.core.models.VnicAttachment] = response.data
-
-            for d in data:
-                vnic_attachments.append(map_vnic_attachment(d))
+        data: list[oci.core.models.VnicAttachment] = await call_sdk(
+            list_records, client.list_vnic_attachments, limit, **kwargs
+        )
+        vnic_attachments = [map_vnic_attachment(d) for d in data]
 
         logger.info(f"Found {len(vnic_attachments)} Vnic Attachments")
         return vnic_attachments
 
+    except oci.exceptions.ServiceError as e:
+        logger.warning(f"OCI error in list_vnic_attachments tool: status={e.status} code={e.code}")
+        raise e
     except Exception as e:
         logger.error(f"Error in list_vnic_attachments tool: {str(e)}")
         raise e
 
 
 @mcp.tool(description="Get Vnic Attachment with a given OCID")
-def get_vnic_attachment(
+async def get_vnic_attachment(
     vnic_attachment_id: str = Field(..., description="The OCID of the vnic attachment"),
 ) -> VnicAttachment:
     try:
-        client = get_compute_client()
+        client = await asyncio.to_thread(get_compute_client)
 
-        response: oci.response.Response = client.get_vnic_attachment(vnic_attachment_id=vnic_attachment_id)
+        response: oci.response.Response = await call_sdk(
+            client.get_vnic_attachment, vnic_attachment_id=vnic_attachment_id
+        )
         data: oci.core.models.VnicAttachment = response.data
         logger.info("Found Vnic Attachment")
         return map_vnic_attachment(data)
 
+    except oci.exceptions.ServiceError as e:
+        logger.warning(f"OCI error in get_vnic_attachment tool: status={e.status} code={e.code}")
+        raise e
     except Exception as e:
         logger.error(f"Error in get_vnic_attachment tool: {str(e)}")
         raise e
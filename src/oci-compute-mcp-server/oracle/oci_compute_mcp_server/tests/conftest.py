@@ -0,0 +1,83 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+from unittest.mock import Mock, patch
+
+import oci
+import pytest
+import pytest_asyncio
+
+# The SDK client's public methods, used as the spec of the client mocks. A spec'd Mock rejects
+# misspelled SDK methods, and a list spec is cheaper to build than a MagicMock or a class spec
+COMPUTE_CLIENT_METHODS = [name for name in dir(oci.core.ComputeClient) if not name.startswith("_")]
+
+
+# server (and with it fastmcp) is imported by the fixtures below rather than at the top of this
+# conftest, so that it is only loaded once a test actually runs
+
+
+@pytest.fixture(scope="session", autouse=True)
+def plain_tracebacks():
+    # The exception tests make FastMCP log every expected tool error with a rich traceback,
+    # whose per-frame source rendering dominated their run time, so plain tracebacks are used.
+    # Importing server first lets fastmcp apply its own logging setup before this overrides it
+    import oracle.oci_compute_mcp_server.server  # noqa: F401
+    from fastmcp.utilities.logging import configure_logging
+
+    configure_logging(enable_rich_tracebacks=False)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def mcp_client():
+    # one connected client for the whole run; tools look up the patched SDK client per call
+    import oracle.oci_compute_mcp_server.server as server
+    from fastmcp import Client
+
+    async with Client(server.mcp) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def call_tool():
+    # runs a tool in-process through FastMCP's tool manager, without the client transport and
+    # the JSON round trip of its arguments and result
+    import oracle.oci_compute_mcp_server.server as server
+
+    return server.mcp._tool_manager.call_tool
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    import oracle.oci_compute_mcp_server.server as server
+
+    server._compute_clients.clear()
+    server._available_images.clear()
+    yield
+    server._compute_clients.clear()
+    server._available_images.clear()
+
+
+@pytest.fixture
+def mock_stat():
+    # get_compute_client stamps clients with the key and token file mtimes; those files
+    # don't exist in tests
+    with patch("oracle.oci_compute_mcp_server.server.os.stat") as stat:
+        yield stat
+
+
+@pytest.fixture(scope="class")
+def patched_get_compute_client():
+    # patched once per test class instead of entered and exited around every test
+    with patch("oracle.oci_compute_mcp_server.server.get_compute_client") as get_compute_client:
+        yield get_compute_client
+
+
+@pytest.fixture
+def mock_client(patched_get_compute_client):
+    # a fresh SDK client mock per test, returned by the class-wide get_compute_client patch
+    patched_get_compute_client.reset_mock(side_effect=True)
+    patched_get_compute_client.return_value = Mock(spec=COMPUTE_CLIENT_METHODS)
+    return patched_get_compute_client.return_value
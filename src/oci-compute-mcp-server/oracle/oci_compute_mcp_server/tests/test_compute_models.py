@@ -215,6 +215,9 @@ async def test_map_licensing_configs():
     assert result[0].license_type == "BRING_YOUR_OWN_LICENSE"
     assert result[1].license_type == "OCI_PROVIDED"
 
+    result = map_licensing_configs([{"license_type": "OCI_PROVIDED"}])
+    assert result[0].license_type == "OCI_PROVIDED"
+
     assert map_licensing_configs(None) is None
     assert map_licensing_configs([]) is None
 
@@ -242,6 +245,20 @@ async def test_map_instance():
     assert result.time_created == oci_instance.time_created
 
 
+@pytest.mark.asyncio
+async def test_map_instance_with_missing_attributes():
+    # objects lacking some attributes fall back to None for them
+    partial = MagicMock(spec=["id", "display_name"])
+    partial.id = "ocid1.instance..partial"
+    partial.display_name = "partial"
+
+    result = map_instance(partial)
+    assert result.id == "ocid1.instance..partial"
+    assert result.display_name == "partial"
+    assert result.shape is None
+    assert result.shape_config is None
+
+
 @pytest.mark.asyncio
 async def test_map_instance_agent_features():
     oci_af = oci.core.models.InstanceAgentFeatures(
@@ -441,6 +458,23 @@ async def test__oci_to_dict_variants(monkeypatch):
     assert helper(NoDict()) is None
 
 
+@pytest.mark.asyncio
+async def test__oci_to_dict_matches_oci_util_to_dict_for_models():
+    from oracle.oci_compute_mcp_server.models import _oci_to_dict as helper
+
+    instance = oci.core.models.Instance(
+        id="instance1",
+        time_created=datetime(2024, 1, 1),
+        freeform_tags={"team": "compute"},
+        shape_config=oci.core.models.InstanceShapeConfig(ocpus=1.0),
+        platform_config=oci.core.models.AmdVmPlatformConfig(type="AMD_VM", is_secure_boot_enabled=True),
+    )
+
+    # Repeated calls reuse the memoized field names and give the same result
+    assert helper(instance) == oci.util.to_dict(instance)
+    assert helper(instance) == oci.util.to_dict(instance)
+
+
 @pytest.mark.asyncio
 async def test_map_platform_config_with_plain_dict_input():
     pc_dict = {"type": "INTEL_VM", "secure_boot": False, "something_else": 123}
@@ -4,24 +4,69 @@ Licensed under the Universal Permissive License v1.0 as shown at
 https://oss.oracle.com/licenses/upl.
 """
 
-from unittest.mock import MagicMock, create_autospec, mock_open, patch
+import asyncio
+import threading
+from unittest.mock import MagicMock, mock_open, patch
 
-import fastmcp.exceptions
 import oci
-import oracle.oci_compute_mcp_server.server as server
+import pydantic
 import pytest
-from fastmcp import Client
-from oracle.oci_compute_mcp_server.server import mcp
+from oracle.oci_compute_mcp_server.consts import DEFAULT_MEMORY_IN_GBS, DEFAULT_OCPU_COUNT
+
+# fastmcp and the server module are imported inside the tests and fixtures that use them, so
+# collecting this module (e.g. --collect-only, or a -k run that deselects it) does not pay for them
+
+# Shared by the exception tests, which only read it back from the ToolError message
+INTERNAL_SERVER_ERROR = oci.exceptions.ServiceError(
+    status=500,
+    code="InternalServerError",
+    message="Internal server error",
+    opc_request_id="test_request_id",
+    headers={},
+)
+
+# Tool arguments shared across tests; tests that need more pass a copy, e.g. {**LAUNCH_ARGS, ...}
+COMPARTMENT_ARGS = {"compartment_id": "test_compartment"}
+INSTANCE_ARGS = {"instance_id": "instance1"}
+LAUNCH_ARGS = {
+    "compartment_id": "test_compartment",
+    "display_name": "test_instance",
+    "availability_domain": "AD1",
+    "subnet_id": "subnet1",
+}
+
+
+def sdk_response():
+    # A plain SDK response, which is far cheaper to build than create_autospec(oci.response.Response);
+    # tests fill in data, status or next_page, and has_next_page follows next_page
+    return oci.response.Response(status=200, headers={}, data=None, request=None)
+
+
+async def batch_invoke(call_tool, calls):
+    # Runs several (tool, arguments) calls concurrently and returns their results in call order;
+    # if one fails, the task group cancels the rest instead of leaving them running
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(call_tool(tool, arguments)) for tool, arguments in calls]
+    return [task.result() for task in tasks]
+
+
+class Recorder:
+    # A stand-in for an SDK method whose arguments a test inspects; it records (args, kwargs)
+    # in a plain list instead of going through MagicMock's call bookkeeping
+    def __init__(self, ret):
+        self.ret = ret
+        self.calls = []
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self.ret
 
 
 class TestComputeTools:
     @pytest.mark.asyncio
-    @patch("oracle.oci_compute_mcp_server.server.get_compute_client")
-    async def test_list_instances(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
-        mock_list_response = create_autospec(oci.response.Response)
+    async def test_list_instances(self, mock_client, mcp_client):
+        # Goes through the MCP client transport end to end; other tests call tools in-process
+        mock_list_response = sdk_response()
         mock_list_response.data = [
             oci.core.models.Instance(
                 id="instance1",
@@ -30,212 +75,222 @@ class TestComputeTools:
                 shape="VM.Standard.E2.1",
             )
         ]
-        mock_list_response.has_next_page = False
-        mock_list_response.next_page = None
         mock_client.list_instances.return_value = mock_list_response
 
-        async with Client(mcp) as client:
-            call_tool_result = await client.call_tool(
-                "list_instances",
-                {"compartment_id": "test_compartment", "lifecycle_state": "RUNNING"},
-            )
-            result = call_tool_result.structured_content["result"]
+        call_tool_result = await mcp_client.call_tool(
+            "list_instances",
+            {"compartment_id": "test_compartment", "lifecycle_state": "RUNNING"},
+        )
+        result = call_tool_result.structured_content["result"]
 
-            assert len(result) == 1
-            assert result[0]["id"] == "instance1"
+        assert len(result) == 1
+        assert result[0]["id"] == "instance1"
 
     @pytest.mark.asyncio
-    @patch("oracle.oci_compute_mcp_server.server.get_compute_client")
-    async def test_list_instances_exception(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
-        # Mock the client to raise an exception
-        mock_client.list_instances.side_effect = oci.exceptions.ServiceError(
-            status=500,
-            code="InternalServerError",
-            message="Internal server error",
-            opc_request_id="test_request_id",
-            headers={},
-        )
+    @pytest.mark.parametrize(
+        "tool, arguments",
+        [
+            ("list_instances", COMPARTMENT_ARGS),
+            ("get_instance", INSTANCE_ARGS),
+            ("launch_instance", {**LAUNCH_ARGS, "image_id": "image1"}),
+            ("terminate_instance", INSTANCE_ARGS),
+            ("update_instance", {"instance_id": "instance1", "ocpus": 2, "memory_in_gbs": 16}),
+            ("list_images", COMPARTMENT_ARGS),
+            ("get_image", {"image_id": "image1"}),
+            ("instance_action", {"instance_id": "instance1", "action": "STOP"}),
+            ("list_vnic_attachments", COMPARTMENT_ARGS),
+            ("get_vnic_attachment", {"vnic_attachment_id": "vnicattachment1"}),
+        ],
+    )
+    async def test_tool_exception(self, mock_client, call_tool, tool, arguments):
+        # Each tool calls the SDK client method of the same name; make it raise
+        getattr(mock_client, tool).side_effect = INTERNAL_SERVER_ERROR
 
-        async with Client(mcp) as client:
-            with pytest.raises(fastmcp.exceptions.ToolError) as e:
-                await client.call_tool("list_instances", {"compartment_id": "test_compartment"})
+        from fastmcp.exceptions import ToolError
+
+        with pytest.raises(ToolError) as e:
+            await call_tool(tool, arguments)
+
+        # Retries live in the SDK client (see test_sdk_retry_strategy_*), so the tool calls the method once
+        getattr(mock_client, tool).assert_called_once()
+        # Verify the ToolError message contains the expected details
+        message = str(e.value)
+        assert f"Error calling tool '{tool}'" in message
+        assert "'status': 500" in message
+        assert "'code': 'InternalServerError'" in message
+        assert "'message': 'Internal server error'" in message
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "tool, arguments",
+        [
+            ("get_instance", {}),
+            ("instance_action", {**INSTANCE_ARGS, "action": "EXPLODE"}),
+            ("batch_instance_action", {"instance_ids": [], "action": "STOP"}),
+        ],
+    )
+    async def test_tool_rejects_invalid_arguments(self, mock_client, call_tool, tool, arguments):
+        # Arguments are validated against the tool's parameters before it runs
+        with pytest.raises(pydantic.ValidationError):
+            await call_tool(tool, arguments)
 
-            # Verify the ToolError message contains the expected details
-            assert "Error calling tool 'list_instances'" in str(e.value)
-            assert "'status': 500" in str(e.value)
-            assert "'code': 'InternalServerError'" in str(e.value)
-            assert "'message': 'Internal server error'" in str(e.value)
+        assert mock_client.mock_calls == []
 
     @pytest.mark.asyncio
-    @patch("oracle.oci_compute_mcp_server.server.get_compute_client")
-    async def test_get_instance(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
+    async def test_list_instances_stops_paging_at_limit(self, mock_client, call_tool):
+        first_page = sdk_response()
+        first_page.data = [oci.core.models.Instance(id="instance1"), oci.core.models.Instance(id="instance2")]
+        first_page.next_page = "page2"
+        second_page = sdk_response()
+        second_page.data = [
+            oci.core.models.Instance(id="instance3"),
+            oci.core.models.Instance(id="instance4"),
+        ]
+        second_page.next_page = "page3"
+        mock_client.list_instances.side_effect = [first_page, second_page]
+
+        call_tool_result = await call_tool(
+            "list_instances", {"compartment_id": "test_compartment", "limit": 3}
+        )
+        result = call_tool_result.structured_content["result"]
+
+        assert [i["id"] for i in result] == ["instance1", "instance2", "instance3"]
+        # The third page is never requested
+        assert mock_client.list_instances.call_count == 2
+        assert mock_client.list_instances.call_args.kwargs == {
+            "compartment_id": "test_compartment",
+            "limit": 3,
+            "page": "page2",
+        }
 
-        mock_get_response = create_autospec(oci.response.Response)
+    @pytest.mark.asyncio
+    async def test_get_instance(self, mock_client, call_tool):
+        mock_get_response = sdk_response()
         mock_get_response.data = oci.core.models.Instance(
             id="instance1", display_name="Instance 1", lifecycle_state="RUNNING"
         )
         mock_client.get_instance.return_value = mock_get_response
 
-        async with Client(mcp) as client:
-            call_tool_result = await client.call_tool("get_instance", {"instance_id": "instance1"})
-            result = call_tool_result.structured_content
+        call_tool_result = await call_tool("get_instance", INSTANCE_ARGS)
+        result = call_tool_result.structured_content
 
-            assert result["id"] == "instance1"
+        assert result["id"] == "instance1"
 
     @pytest.mark.asyncio
-    @patch("oracle.oci_compute_mcp_server.server.get_compute_client")
-    async def test_get_instance_exception(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
+    async def test_get_instance_runs_sdk_call_on_sdk_worker_thread(self, mock_client, call_tool):
+        threads = []
+
+        def get_instance(instance_id):
+            threads.append(threading.current_thread().name)
+            response = sdk_response()
+            response.data = oci.core.models.Instance(id=instance_id)
+            return response
 
-        # Mock the client to raise an exception
+        mock_client.get_instance.side_effect = get_instance
+
+        await call_tool("get_instance", INSTANCE_ARGS)
+
+        assert len(threads) == 1
+        assert threads[0].startswith("oci-sdk")
+
+    @pytest.mark.asyncio
+    @patch("oracle.oci_compute_mcp_server.server.logger")
+    async def test_get_instance_logs_service_errors_compactly(self, mock_logger, mock_client, call_tool):
         mock_client.get_instance.side_effect = oci.exceptions.ServiceError(
-            status=500,
-            code="InternalServerError",
-            message="Internal server error",
+            status=404,
+            code="NotAuthorizedOrNotFound",
+            message="Authorization failed or requested resource not found",
             opc_request_id="test_request_id",
             headers={},
         )
 
-        async with Client(mcp) as client:
-            with pytest.raises(fastmcp.exceptions.ToolError) as e:
-                await client.call_tool("get_instance", {"instance_id": "instance1"})
+        from fastmcp.exceptions import ToolError
 
-            # Verify the ToolError message contains the expected details
-            assert "Error calling tool 'get_instance'" in str(e.value)
-            assert "'status': 500" in str(e.value)
-            assert "'code': 'InternalServerError'" in str(e.value)
-            assert "'message': 'Internal server error'" in str(e.value)
+        with pytest.raises(ToolError):
+            await call_tool("get_instance", INSTANCE_ARGS)
 
-    @pytest.mark.asyncio
-    @patch("oracle.oci_compute_mcp_server.server.get_compute_client")
-    async def test_launch_instance(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
+        mock_logger.warning.assert_called_once_with(
+            "OCI error in get_instance tool: status=404 code=NotAuthorizedOrNotFound"
+        )
+        mock_logger.error.assert_not_called()
 
-        mock_launch_response = create_autospec(oci.response.Response)
+    @pytest.mark.asyncio
+    async def test_launch_instance(self, mock_client, call_tool):
+        mock_launch_response = sdk_response()
         mock_launch_response.data = oci.core.models.Instance(
             id="instance1", display_name="Instance 1", lifecycle_state="PROVISIONING"
         )
-        mock_client.launch_instance.return_value = mock_launch_response
-
-        async with Client(mcp) as client:
-            result = (
-                await client.call_tool(
-                    "launch_instance",
-                    {
-                        "compartment_id": "test_compartment",
-                        "display_name": "test_instance",
-                        "availability_domain": "AD1",
-                        "image_id": "image1",
-                        "subnet_id": "subnet1",
-                    },
-                )
-            ).structured_content
+        mock_client.launch_instance = Recorder(mock_launch_response)
 
-            assert result["id"] == "instance1"
-            assert result["lifecycle_state"] == "PROVISIONING"
+        result = (
+            await call_tool("launch_instance", {**LAUNCH_ARGS, "image_id": "image1"})
+        ).structured_content
+
+        assert result["id"] == "instance1"
+        assert result["lifecycle_state"] == "PROVISIONING"
+
+        (launch_details,), _ = mock_client.launch_instance.calls[-1]
+        assert launch_details.shape_config.ocpus == 1
+        assert launch_details.shape_config.memory_in_gbs == 12
 
     @pytest.mark.asyncio
-    @patch("oracle.oci_compute_mcp_server.server.get_compute_client")
-    async def test_launch_instance_exception(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
-        # Mock the client to raise an exception
-        mock_client.launch_instance.side_effect = oci.exceptions.ServiceError(
-            status=500,
-            code="InternalServerError",
-            message="Internal server error",
-            opc_request_id="test_request_id",
-            headers={},
+    async def test_launch_instance_builds_shape_config_per_launch(self, mock_client, call_tool):
+        mock_launch_response = sdk_response()
+        mock_launch_response.data = oci.core.models.Instance(id="instance1")
+        mock_client.launch_instance = Recorder(mock_launch_response)
+
+        await batch_invoke(
+            call_tool,
+            [
+                ("launch_instance", LAUNCH_ARGS),
+                ("launch_instance", LAUNCH_ARGS),
+                ("launch_instance", {**LAUNCH_ARGS, "ocpus": 2, "memory_in_gbs": 24}),
+            ],
         )
 
-        async with Client(mcp) as client:
-            with pytest.raises(fastmcp.exceptions.ToolError) as e:
-                await client.call_tool(
-                    "launch_instance",
-                    {
-                        "compartment_id": "test_compartment",
-                        "display_name": "test_instance",
-                        "availability_domain": "AD1",
-                        "image_id": "image1",
-                        "subnet_id": "subnet1",
-                    },
-                )
-
-            # Verify the ToolError message contains the expected details
-            assert "Error calling tool 'launch_instance'" in str(e.value)
-            assert "'status': 500" in str(e.value)
-            assert "'code': 'InternalServerError'" in str(e.value)
-            assert "'message': 'Internal server error'" in str(e.value)
+        # The launches run concurrently, so group the shape configs by size rather than call order
+        configs_by_size = {}
+        for (launch_details,), _ in mock_client.launch_instance.calls:
+            config = launch_details.shape_config
+            configs_by_size.setdefault((config.ocpus, config.memory_in_gbs), set()).add(id(config))
+        assert configs_by_size.keys() == {(DEFAULT_OCPU_COUNT, DEFAULT_MEMORY_IN_GBS), (2, 24)}
+        # Launches of the same size don't share a (mutable) model
+        assert len(configs_by_size[(DEFAULT_OCPU_COUNT, DEFAULT_MEMORY_IN_GBS)]) == 2
 
     @pytest.mark.asyncio
-    @patch("oracle.oci_compute_mcp_server.server.get_compute_client")
-    async def test_terminate_instance(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
-        mock_delete_response = create_autospec(oci.response.Response)
-        mock_delete_response.status = 204
-        mock_client.terminate_instance.return_value = mock_delete_response
+    async def test_launch_instance_fixed_shape_has_no_shape_config(self, mock_client, call_tool):
+        mock_launch_response = sdk_response()
+        mock_launch_response.data = oci.core.models.Instance(id="instance1", shape="VM.Standard2.1")
+        mock_client.launch_instance = Recorder(mock_launch_response)
 
-        async with Client(mcp) as client:
-            call_tool_result = await client.call_tool(
-                "terminate_instance",
-                {
-                    "instance_id": "instance1",
-                },
-            )
-            result = call_tool_result.structured_content
+        await call_tool("launch_instance", {**LAUNCH_ARGS, "shape": "VM.Standard2.1"})
 
-            assert result["status"] == 204
+        (launch_details,), _ = mock_client.launch_instance.calls[-1]
+        assert launch_details.shape == "VM.Standard2.1"
+        assert launch_details.shape_config is None
 
     @pytest.mark.asyncio
-    @patch("oracle.oci_compute_mcp_server.server.get_compute_client")
-    async def test_terminate_instance_exception(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
-        # Mock the client to raise an exception
-        mock_client.terminate_instance.side_effect = oci.exceptions.ServiceError(
-            status=500,
-            code="InternalServerError",
-            message="Internal server error",
-            opc_request_id="test_request_id",
-            headers={},
-        )
+    async def test_terminate_instance(self, mock_client, call_tool):
+        mock_delete_response = sdk_response()
+        mock_delete_response.status = 204
+        mock_client.terminate_instance.return_value = mock_delete_response
 
-        async with Client(mcp) as client:
-            with pytest.raises(fastmcp.exceptions.ToolError) as e:
-                await client.call_tool(
-                    "terminate_instance",
-                    {
-                        "instance_id": "instance1",
-                    },
-                )
+        call_tool_result = await call_tool(
+            "terminate_instance",
+            {
+                "instance_id": "instance1",
+            },
+        )
+        result = call_tool_result.structured_content
 
-            # Verify the ToolError message contains the expected details
-            assert "Error calling tool 'terminate_instance'" in str(e.value)
-            assert "'status': 500" in str(e.value)
-            assert "'code': 'InternalServerError'" in str(e.value)
-            assert "'message': 'Internal server error'" in str(e.value)
+        assert result["status"] == 204
 
     @pytest.mark.asyncio
-    @patch("oracle.oci_compute_mcp_server.server.get_compute_client")
-    async def test_update_instance(self, mock_get_client):
+    async def test_update_instance(self, mock_client, call_tool):
         ocpus = 2
         memory_in_gbs = 16
 
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
-        mock_update_response = create_autospec(oci.response.Response)
+        mock_update_response = sdk_response()
         mock_update_response.data = oci.core.models.Instance(
             shape_config=oci.core.models.UpdateInstanceShapeConfigDetails(
                 ocpus=ocpus,
@@ -244,121 +299,52 @@ class TestComputeTools:
         )
         mock_client.update_instance.return_value = mock_update_response
 
-        async with Client(mcp) as client:
-            call_tool_result = await client.call_tool(
-                "update_instance",
-                {
-                    "instance_id": "instance1",
-                    "ocpus": ocpus,
-                    "memory_in_gbs": memory_in_gbs,
-                },
-            )
-            result = call_tool_result.structured_content
-
-            assert result["shape_config"]["ocpus"] == ocpus
-            assert result["shape_config"]["memory_in_gbs"] == memory_in_gbs
-
-    @pytest.mark.asyncio
-    @patch("oracle.oci_compute_mcp_server.server.get_compute_client")
-    async def test_update_instance_exception(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
-        # Mock the client to raise an exception
-        mock_client.update_instance.side_effect = oci.exceptions.ServiceError(
-            status=500,
-            code="InternalServerError",
-            message="Internal server error",
-            opc_request_id="test_request_id",
-            headers={},
+        call_tool_result = await call_tool(
+            "update_instance",
+            {
+                "instance_id": "instance1",
+                "ocpus": ocpus,
+                "memory_in_gbs": memory_in_gbs,
+            },
         )
+        result = call_tool_result.structured_content
 
-        async with Client(mcp) as client:
-            with pytest.raises(fastmcp.exceptions.ToolError) as e:
-                await client.call_tool(
-                    "update_instance",
-                    {
-                        "instance_id": "instance1",
-                        "ocpus": 2,
-                        "memory_in_gbs": 16,
-                    },
-                )
-
-            # Verify the ToolError message contains the expected details
-            assert "Error calling tool 'update_instance'" in str(e.value)
-            assert "'status': 500" in str(e.value)
-            assert "'code': 'InternalServerError'" in str(e.value)
-            assert "'message': 'Internal server error'" in str(e.value)
+        assert result["shape_config"]["ocpus"] == ocpus
+        assert result["shape_config"]["memory_in_gbs"] == memory_in_gbs
 
     @pytest.mark.asyncio
-    @patch("oracle.oci_compute_mcp_server.server.get_compute_client")
-    async def test_list_images(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
-        mock_list_response = create_autospec(oci.response.Response)
+    @pytest.mark.parametrize("operating_system", ["Oracle Linux", None])
+    async def test_list_images(self, mock_client, call_tool, operating_system):
+        mock_list_response = sdk_response()
         mock_list_response.data = [
             oci.core.models.Image(
                 id="image1",
                 display_name="Image 1",
                 operating_system="Oracle Linux",
                 operating_system_version="8",
-            )
+            ),
+            oci.core.models.Image(
+                id="image2",
+                display_name="Image 2",
+                operating_system="Ubuntu",
+                operating_system_version="22.04",
+            ),
         ]
-        mock_list_response.has_next_page = False
-        mock_list_response.next_page = None
-        mock_client.list_images.return_value = mock_list_response
-
-        async with Client(mcp) as client:
-            call_tool_result = await client.call_tool(
-                "list_images",
-                {
-                    "compartment_id": "test_compartment",
-                    "operating_system": "Oracle Linux",
-                },
-            )
-            result = call_tool_result.structured_content["result"]
-
-            assert len(result) == 1
-            assert result[0]["id"] == "image1"
-
-    @pytest.mark.asyncio
-    @patch("oracle.oci_compute_mcp_server.server.get_compute_client")
-    async def test_list_images_exception(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
-        # Mock the client to raise an exception
-        mock_client.list_images.side_effect = oci.exceptions.ServiceError(
-            status=500,
-            code="InternalServerError",
-            message="Internal server error",
-            opc_request_id="test_request_id",
-            headers={},
-        )
+        mock_client.list_images = Recorder(mock_list_response)
 
-        async with Client(mcp) as client:
-            with pytest.raises(fastmcp.exceptions.ToolError) as e:
-                await client.call_tool(
-                    "list_images",
-                    {
-                        "compartment_id": "test_compartment",
-                    },
-                )
+        arguments = dict(COMPARTMENT_ARGS)
+        if operating_system is not None:
+            arguments["operating_system"] = operating_system
+        call_tool_result = await call_tool("list_images", arguments)
+        result = call_tool_result.structured_content["result"]
 
-            # Verify the ToolError message contains the expected details
-            assert "Error calling tool 'list_images'" in str(e.value)
-            assert "'status': 500" in str(e.value)
-            assert "'code': 'InternalServerError'" in str(e.value)
-            assert "'message': 'Internal server error'" in str(e.value)
+        # The operating system filter is applied by the service, not by the tool
+        assert [img["id"] for img in result] == ["image1", "image2"]
+        assert mock_client.list_images.calls[-1][1]["operating_system"] == operating_system
 
     @pytest.mark.asyncio
-    @patch("oracle.oci_compute_mcp_server.server.get_compute_client")
-    async def test_get_image(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
-        mock_get_response = create_autospec(oci.response.Response)
+    async def test_get_image(self, mock_client, call_tool):
+        mock_get_response = sdk_response()
         mock_get_response.data = oci.core.models.Image(
             id="image1",
             display_name="Image 1",
@@ -367,52 +353,75 @@ class TestComputeTools:
         )
         mock_client.get_image.return_value = mock_get_response
 
-        async with Client(mcp) as client:
-            call_tool_result = await client.call_tool(
-                "get_image",
-                {"image_id": "image1"},
-            )
-            result = call_tool_result.structured_content
+        call_tool_result = await call_tool(
+            "get_image",
+            {"image_id": "image1"},
+        )
+        result = call_tool_result.structured_content
 
-            assert result["id"] == "image1"
+        assert result["id"] == "image1"
 
     @pytest.mark.asyncio
-    @patch("oracle.oci_compute_mcp_server.server.get_compute_client")
-    async def test_get_image_exception(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
-        # Mock the client to raise an exception
-        mock_client.get_image.side_effect = oci.exceptions.ServiceError(
-            status=500,
-            code="InternalServerError",
-            message="Internal server error",
-            opc_request_id="test_request_id",
-            headers={},
-        )
+    async def test_get_image_caches_available_images(self, mock_client, call_tool):
+        fetched = []
+
+        def get_image(image_id):
+            fetched.append(image_id)
+            response = sdk_response()
+            response.data = oci.core.models.Image(
+                id=image_id,
+                lifecycle_state="AVAILABLE" if image_id == "image1" else "PROVISIONING",
+            )
+            return response
 
-        async with Client(mcp) as client:
-            with pytest.raises(fastmcp.exceptions.ToolError) as e:
-                await client.call_tool(
-                    "get_image",
-                    {
-                        "image_id": "image1",
-                    },
-                )
+        mock_client.get_image.side_effect = get_image
+
+        # The lookups within a pass are independent and run concurrently; the second pass
+        # must wait for the first so that it sees the cache
+        for _ in range(2):
+            results = await batch_invoke(
+                call_tool, [("get_image", {"image_id": image_id}) for image_id in ("image1", "image2")]
+            )
+            assert [r.structured_content["id"] for r in results] == ["image1", "image2"]
 
-            # Verify the ToolError message contains the expected details
-            assert "Error calling tool 'get_image'" in str(e.value)
-            assert "'status': 500" in str(e.value)
-            assert "'code': 'InternalServerError'" in str(e.value)
-            assert "'message': 'Internal server error'" in str(e.value)
+        # Only the image that is still provisioning is fetched again
+        assert sorted(fetched[:2]) == ["image1", "image2"]
+        assert fetched[2:] == ["image2"]
 
     @pytest.mark.asyncio
-    @patch("oracle.oci_compute_mcp_server.server.get_compute_client")
-    async def test_instance_action(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
+    async def test_get_image_cache_is_per_profile_and_expires(
+        self, mock_client, patched_get_compute_client, call_tool, monkeypatch
+    ):
+        import oracle.oci_compute_mcp_server.server as server
+        from fastmcp.exceptions import ToolError
 
-        mock_action_response = create_autospec(oci.response.Response)
+        mock_get_response = sdk_response()
+        mock_get_response.data = oci.core.models.Image(id="image1", lifecycle_state="AVAILABLE")
+        mock_client.get_image.return_value = mock_get_response
+        arguments = {"image_id": "image1"}
+
+        # Another profile does not see the image the first profile fetched
+        await call_tool("get_image", arguments)
+        monkeypatch.setenv("OCI_CONFIG_PROFILE", "OTHER_PROFILE")
+        await call_tool("get_image", arguments)
+        await call_tool("get_image", arguments)
+        assert mock_client.get_image.call_count == 2
+
+        # Once the TTL has passed the image is fetched again
+        for key, (stamp, image) in list(server._available_images.items()):
+            server._available_images[key] = (stamp - server.AVAILABLE_IMAGE_TTL, image)
+        await call_tool("get_image", arguments)
+        assert mock_client.get_image.call_count == 3
+
+        # A cached image is not served when the client can't be built
+        patched_get_compute_client.side_effect = oci.exceptions.ConfigFileNotFound("no config")
+        with pytest.raises(ToolError):
+            await call_tool("get_image", arguments)
+        assert mock_client.get_image.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_instance_action(self, mock_client, call_tool):
+        mock_action_response = sdk_response()
         mock_action_response.data = oci.core.models.Instance(
             id="instance1",
             display_name="Instance 1",
@@ -421,57 +430,74 @@ class TestComputeTools:
         )
         mock_client.instance_action.return_value = mock_action_response
 
-        async with Client(mcp) as client:
-            call_tool_result = await client.call_tool(
-                "instance_action",
-                {
-                    "instance_id": "instance1",
-                    "action": "STOP",
-                },
-            )
-            result = call_tool_result.structured_content
+        call_tool_result = await call_tool(
+            "instance_action",
+            {
+                "instance_id": "instance1",
+                "action": "STOP",
+            },
+        )
+        result = call_tool_result.structured_content
 
-            assert result["id"] == "instance1"
-            assert result["lifecycle_state"] == "STOPPING"
+        assert result["id"] == "instance1"
+        assert result["lifecycle_state"] == "STOPPING"
 
     @pytest.mark.asyncio
-    @patch("oracle.oci_compute_mcp_server.server.get_compute_client")
-    async def test_instance_action_exception(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
-        # Mock the client to raise an exception
-        mock_client.instance_action.side_effect = oci.exceptions.ServiceError(
-            status=500,
-            code="InternalServerError",
-            message="Internal server error",
-            opc_request_id="test_request_id",
-            headers={},
-        )
-
-        async with Client(mcp) as client:
-            with pytest.raises(fastmcp.exceptions.ToolError) as e:
-                await client.call_tool(
-                    "instance_action",
-                    {
-                        "instance_id": "instance1",
-                        "action": "STOP",
-                    },
+    async def test_batch_instance_action(self, mock_client, call_tool):
+        def instance_action(instance_id, action):
+            if instance_id == "instance2":
+                raise oci.exceptions.ServiceError(
+                    status=404,
+                    code="NotAuthorizedOrNotFound",
+                    message="Not found",
+                    opc_request_id="test_request_id",
+                    headers={},
                 )
+            response = sdk_response()
+            response.data = oci.core.models.Instance(id=instance_id, lifecycle_state="STOPPING")
+            return response
+
+        mock_client.instance_action.side_effect = instance_action
+
+        call_tool_result = await call_tool(
+            "batch_instance_action",
+            {
+                "instance_ids": ["instance1", "instance2", "instance3"],
+                "action": "STOP",
+            },
+        )
+        result = call_tool_result.structured_content
 
-            # Verify the ToolError message contains the expected details
-            assert "Error calling tool 'instance_action'" in str(e.value)
-            assert "'status': 500" in str(e.value)
-            assert "'code': 'InternalServerError'" in str(e.value)
-            assert "'message': 'Internal server error'" in str(e.value)
+        assert [i["id"] for i in result["instances"]] == ["instance1", "instance3"]
+        assert len(result["failures"]) == 1
+        assert result["failures"][0]["instance_id"] == "instance2"
+        assert "NotAuthorizedOrNotFound" in result["failures"][0]["error"]
+        assert mock_client.instance_action.call_count == 3
 
     @pytest.mark.asyncio
-    @patch("oracle.oci_compute_mcp_server.server.get_compute_client")
-    async def test_list_vnic_attachments(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
+    async def test_batch_instance_action_reports_cancelled_action(self, mock_client, call_tool):
+        def instance_action(instance_id, action):
+            if instance_id == "instance2":
+                raise asyncio.CancelledError()
+            response = sdk_response()
+            response.data = oci.core.models.Instance(id=instance_id, lifecycle_state="STOPPING")
+            return response
+
+        mock_client.instance_action.side_effect = instance_action
+
+        call_tool_result = await call_tool(
+            "batch_instance_action",
+            {"instance_ids": ["instance1", "instance2"], "action": "STOP"},
+        )
+        result = call_tool_result.structured_content
 
-        mock_list_response = create_autospec(oci.response.Response)
+        # gather() hands back the CancelledError, which is not an Exception subclass
+        assert [i["id"] for i in result["instances"]] == ["instance1"]
+        assert [f["instance_id"] for f in result["failures"]] == ["instance2"]
+
+    @pytest.mark.asyncio
+    async def test_list_vnic_attachments(self, mock_client, call_tool):
+        mock_list_response = sdk_response()
         mock_list_response.data = [
             oci.core.models.VnicAttachment(
                 id="vnicattachment1",
@@ -479,57 +505,20 @@ class TestComputeTools:
                 lifecycle_state="ATTACHED",
             )
         ]
-        mock_list_response.has_next_page = False
-        mock_list_response.next_page = None
         mock_client.list_vnic_attachments.return_value = mock_list_response
 
-        async with Client(mcp) as client:
-            call_tool_result = await client.call_tool(
-                "list_vnic_attachments",
-                {"compartment_id": "test_compartment", "instance_id": "instance1"},
-            )
-            result = call_tool_result.structured_content["result"]
-
-            assert len(result) == 1
-            assert result[0]["id"] == "vnicattachment1"
-
-    @pytest.mark.asyncio
-    @patch("oracle.oci_compute_mcp_server.server.get_compute_client")
-    async def test_list_vnic_attachments_exception(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
-        # Mock the client to raise an exception
-        mock_client.list_vnic_attachments.side_effect = oci.exceptions.ServiceError(
-            status=500,
-            code="InternalServerError",
-            message="Internal server error",
-            opc_request_id="test_request_id",
-            headers={},
+        call_tool_result = await call_tool(
+            "list_vnic_attachments",
+            {"compartment_id": "test_compartment", "instance_id": "instance1"},
         )
+        result = call_tool_result.structured_content["result"]
 
-        async with Client(mcp) as client:
-            with pytest.raises(fastmcp.exceptions.ToolError) as e:
-                await client.call_tool(
-                    "list_vnic_attachments",
-                    {
-                        "compartment_id": "test_compartment",
-                    },
-                )
-
-            # Verify the ToolError message contains the expected details
-            assert "Error calling tool 'list_vnic_attachments'" in str(e.value)
-            assert "'status': 500" in str(e.value)
-            assert "'code': 'InternalServerError'" in str(e.value)
-            assert "'message': 'Internal server error'" in str(e.value)
+        assert len(result) == 1
+        assert result[0]["id"] == "vnicattachment1"
 
     @pytest.mark.asyncio
-    @patch("oracle.oci_compute_mcp_server.server.get_compute_client")
-    async def test_get_vnic_attachment(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
-        mock_get_response = create_autospec(oci.response.Response)
+    async def test_get_vnic_attachment(self, mock_client, call_tool):
+        mock_get_response = sdk_response()
         mock_get_response.data = oci.core.models.VnicAttachment(
             id="vnicattachment1",
             display_name="VNIC attachment 1",
@@ -537,41 +526,26 @@ class TestComputeTools:
         )
         mock_client.get_vnic_attachment.return_value = mock_get_response
 
-        async with Client(mcp) as client:
-            call_tool_result = await client.call_tool(
-                "get_vnic_attachment", {"vnic_attachment_id": "vnicattachment1"}
-            )
-            result = call_tool_result.structured_content
+        call_tool_result = await call_tool("get_vnic_attachment", {"vnic_attachment_id": "vnicattachment1"})
+        result = call_tool_result.structured_content
 
-            assert result["id"] == "vnicattachment1"
+        assert result["id"] == "vnicattachment1"
 
-    @pytest.mark.asyncio
-    @patch("oracle.oci_compute_mcp_server.server.get_compute_client")
-    async def test_get_vnic_attachment_exception(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
-        # Mock the client to raise an exception
-        mock_client.get_vnic_attachment.side_effect = oci.exceptions.ServiceError(
-            status=500,
-            code="InternalServerError",
-            message="Internal server error",
-            opc_request_id="test_request_id",
-            headers={},
-        )
-
-        async with Client(mcp) as client:
-            with pytest.raises(fastmcp.exceptions.ToolError) as e:
-                await client.call_tool("get_vnic_attachment", {"vnic_attachment_id": "vnicattachment1"})
 
-            # Verify the ToolError message contains the expected details
-            assert "Error calling tool 'get_vnic_attachment'" in str(e.value)
-            assert "'status': 500" in str(e.value)
-            assert "'code': 'InternalServerError'" in str(e.value)
-            assert "'message': 'Internal server error'" in str(e.value)
+class TestServer:
+    @pytest.mark.parametrize(
+        "value, expected",
+        [(None, 8), ("16", 16), ("1", 1), ("0", 1), ("-4", 1), ("many", 8), ("", 8)],
+    )
+    def test_sdk_concurrency(self, monkeypatch, value, expected):
+        import oracle.oci_compute_mcp_server.server as server
 
+        if value is None:
+            monkeypatch.delenv("OCI_MCP_CONCURRENCY", raising=False)
+        else:
+            monkeypatch.setenv("OCI_MCP_CONCURRENCY", value)
+        assert server._sdk_concurrency() == expected
 
-class TestServer:
     @patch("oracle.oci_compute_mcp_server.server.mcp.run")
     @patch("os.getenv")
     def test_main_with_host_and_port(self, mock_getenv, mock_mcp_run):
@@ -623,44 +597,8 @@ class TestServer:
         server.main()
         mock_mcp_run.assert_called_once_with()
 
-    @pytest.mark.asyncio
-    @patch("oracle.oci_compute_mcp_server.server.get_compute_client")
-    async def test_list_images_without_filter(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
-        mock_list_response = create_autospec(oci.response.Response)
-        mock_list_response.data = [
-            oci.core.models.Image(
-                id="image1",
-                display_name="Image 1",
-                operating_system="Oracle Linux",
-                operating_system_version="8",
-            ),
-            oci.core.models.Image(
-                id="image2",
-                display_name="Image 2",
-                operating_system="Ubuntu",
-                operating_system_version="22.04",
-            ),
-        ]
-        mock_list_response.has_next_page = False
-        mock_list_response.next_page = None
-        mock_client.list_images.return_value = mock_list_response
-
-        async with Client(mcp) as client:
-            call_tool_result = await client.call_tool(
-                "list_images",
-                {
-                    "compartment_id": "test_compartment",
-                },
-            )
-            result = call_tool_result.structured_content["result"]
-
-            assert len(result) == 2
-            assert {img["id"] for img in result} == {"image1", "image2"}
-
 
+@pytest.mark.usefixtures("mock_stat")
 class TestGetClient:
     @patch("oracle.oci_compute_mcp_server.server.oci.core.ComputeClient")
     @patch("oracle.oci_compute_mcp_server.server.oci.auth.signers.SecurityTokenSigner")
@@ -693,6 +631,8 @@ class TestGetClient:
         private_key_obj = object()
         mock_load_private_key.return_value = private_key_obj
 
+        import oracle.oci_compute_mcp_server.server as server
+
         # Act
         result = server.get_compute_client()
 
@@ -740,6 +680,8 @@ class TestGetClient:
         priv = object()
         mock_load_private_key.return_value = priv
 
+        import oracle.oci_compute_mcp_server.server as server
+
         # Act
         srv_client = server.get_compute_client()
 
@@ -761,3 +703,66 @@ class TestGetClient:
         assert isinstance(config["additional_user_agent"], str) and "/" in config["additional_user_agent"]
         # Returned object is client instance
         assert srv_client is mock_client.return_value
+
+    @patch("oracle.oci_compute_mcp_server.server.oci.core.ComputeClient")
+    @patch("oracle.oci_compute_mcp_server.server.oci.auth.signers.SecurityTokenSigner")
+    @patch("oracle.oci_compute_mcp_server.server.oci.signer.load_private_key_from_file")
+    @patch(
+        "oracle.oci_compute_mcp_server.server.open",
+        new_callable=mock_open,
+        read_data="TOK",
+    )
+    @patch("oracle.oci_compute_mcp_server.server.oci.config.from_file")
+    def test_get_compute_client_is_reused_until_token_changes(
+        self,
+        mock_from_file,
+        mock_open_file,
+        mock_load_private_key,
+        mock_security_token_signer,
+        mock_client,
+        mock_stat,
+    ):
+        mock_from_file.side_effect = lambda **kwargs: {
+            "key_file": "/k.pem",
+            "security_token_file": "/tkn",
+        }
+        mock_client.side_effect = lambda *args, **kwargs: MagicMock()
+        mock_stat.return_value.st_mtime_ns = 1
+
+        import oracle.oci_compute_mcp_server.server as server
+
+        first = server.get_compute_client()
+        second = server.get_compute_client()
+
+        assert second is first
+        mock_client.assert_called_once()
+        mock_open_file.assert_called_once_with("/tkn", "r")
+        assert mock_client.call_args.kwargs["timeout"] == server.SDK_TIMEOUT
+        assert mock_client.call_args.kwargs["retry_strategy"] is server.SDK_RETRY_STRATEGY
+        prefix, adapter = first.base_client.session.mount.call_args.args
+        assert prefix == "https://"
+        assert adapter._pool_maxsize == server.SDK_CONCURRENCY
+
+        # A refreshed session token builds a new signer and client
+        mock_stat.return_value.st_mtime_ns = 2
+        third = server.get_compute_client()
+
+        assert third is not first
+        assert mock_client.call_count == 2
+        assert mock_security_token_signer.call_count == 2
+
+    @patch("oci.retry.retry.time.sleep")
+    def test_sdk_retry_strategy_retries_throttling_and_transient_errors(self, mock_sleep):
+        def service_error(status):
+            return oci.exceptions.ServiceError(status=status, code="Error", message="error", headers={})
+
+        import oracle.oci_compute_mcp_server.server as server
+
+        call = MagicMock(__name__="get_instance", side_effect=[service_error(429), service_error(503), "ok"])
+        assert server.SDK_RETRY_STRATEGY.make_retrying_call(call) == "ok"
+        assert call.call_count == 3
+
+        call = MagicMock(__name__="get_instance", side_effect=[service_error(404), "ok"])
+        with pytest.raises(oci.exceptions.ServiceError):
+            server.SDK_RETRY_STRATEGY.make_retrying_call(call)
+        assert call.call_count == 1
@@ -4,9 +4,12 @@ Licensed under the Universal Permissive License v1.0 as shown at
 https://oss.oracle.com/licenses/upl.
 """
 
+import atexit
 import base64
 import json
 import os
+import threading
+import time
 from logging import Logger
 from typing import Literal, Optional
 
@@ -35,19 +38,60 @@ logger = Logger(__name__, level="INFO")
 mcp = FastMCP(name=__project__)
 
 
-def get_identity_client():
-    config = oci.config.from_file(
-        file_location=os.getenv("OCI_CONFIG_FILE", oci.config.DEFAULT_LOCATION),
-        profile_name=os.getenv("OCI_CONFIG_PROFILE", oci.config.DEFAULT_PROFILE),
+# Identity clients keyed by (config file, profile). A cached client is reused while its config
+# and its key and security token files are unchanged, so its HTTPS connection pool survives
+# across tool calls; a refreshed session token yields a new client.
+_identity_clients: dict[tuple[str, str], tuple[tuple, oci.identity.IdentityClient]] = {}
+_identity_clients_lock = threading.Lock()
+
+
+def _config_key() -> tuple[str, str]:
+    return (
+        os.getenv("OCI_CONFIG_FILE", oci.config.DEFAULT_LOCATION),
+        os.getenv("OCI_CONFIG_PROFILE", oci.config.DEFAULT_PROFILE),
     )
+
+
+def get_identity_client():
+    config_file, profile = _config_key()
+    config = oci.config.from_file(file_location=config_file, profile_name=profile)
     user_agent_name = __project__.split("oracle.", 1)[1].split("-server", 1)[0]
     config["additional_user_agent"] = f"{user_agent_name}/{__version__}"
-    private_key = oci.signer.load_private_key_from_file(config["key_file"])
+
+    key_file = os.path.expanduser(config["key_file"])
     token_file = os.path.expanduser(config["security_token_file"])
-    with open(token_file, "r") as f:
-        token = f.read()
-    signer = oci.auth.signers.SecurityTokenSigner(token, private_key)
-    return oci.identity.IdentityClient(config, signer=signer)
+    stamp = (
+        sorted(config.items()),
+        os.stat(key_file).st_mtime_ns,
+        os.stat(token_file).st_mtime_ns,
+    )
+    with _identity_clients_lock:
+        cached = _identity_clients.get((config_file, profile))
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        private_key = oci.signer.load_private_key_from_file(key_file)
+        with open(token_file, "r") as f:
+            token = f.read()
+        signer = oci.auth.signers.SecurityTokenSigner(token, private_key)
+        client = oci.identity.IdentityClient(config, signer=signer)
+        _identity_clients[(config_file, profile)] = (stamp, client)
+        return client
+
+
+@atexit.register
+def _close_identity_clients():
+    with _identity_clients_lock:
+        for _, client in _identity_clients.values():
+            client.base_client.session.close()
+        _identity_clients.clear()
+
+
+# Compartment OCIDs found by get_compartment_by_name, keyed by (config file, profile, parent
+# compartment, name) and stamped with time.monotonic(). Within COMPARTMENT_ID_TTL seconds a
+# repeated lookup gets the compartment directly instead of listing the parent's children again.
+COMPARTMENT_ID_TTL = 5.0
+_compartment_ids: dict[tuple[str, str, str, str], tuple[float, str]] = {}
 
 
 @mcp.tool(description="List compartments in a given compartment or tenancy.")
@@ -269,6 +313,25 @@ def get_compartment_by_name(
     try:
         client = get_identity_client()
 
+        key = (*_config_key(), parent_compartment_id, name)
+        cached = _compartment_ids.get(key)
+        if cached is not None and time.monotonic() - cached[0] < COMPARTMENT_ID_TTL:
+            try:
+                cmp = client.get_compartment(cached[1]).data
+            except oci.exceptions.ServiceError as e:
+                # Deleted, moved or no longer authorized; list the parent's children again
+                logger.info(f"Cached compartment for {name} is no longer usable: {e.code}")
+                cmp = None
+            if (
+                cmp is not None
+                and cmp.name == name
+                and cmp.compartment_id == parent_compartment_id
+                and cmp.lifecycle_state == "ACTIVE"
+            ):
+                logger.info(f"Found compartment: {name}")
+                return map_compartment(cmp)
+            _compartment_ids.pop(key, None)
+
         has_next_page = True
         next_page: str = None
 
@@ -283,6 +346,7 @@ def get_compartment_by_name(
             for cmp in response.data:
                 if cmp.name == name:
                     logger.info(f"Found compartment: {name}")
+                    _compartment_ids[key] = (time.monotonic(), cmp.id)
                     return map_compartment(cmp)
 
             has_next_page = response.has_next_page
@@ -0,0 +1,63 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+from unittest.mock import Mock, patch
+
+import oci
+import oracle.oci_identity_mcp_server.server as server
+import pytest
+import pytest_asyncio
+from fastmcp import Client
+
+# The SDK client's public methods, used as the spec of the client mocks. A spec'd Mock rejects
+# misspelled SDK methods, and a list spec is cheaper to build than a MagicMock or a class spec
+IDENTITY_CLIENT_METHODS = [name for name in dir(oci.identity.IdentityClient) if not name.startswith("_")]
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def mcp_client():
+    # one connected client for the whole run; tools look up the patched SDK client per call
+    async with Client(server.mcp) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def call_tool():
+    # runs a tool in-process through FastMCP's tool manager, without the client transport and
+    # the JSON round trip of its arguments and result
+    return server.mcp._tool_manager.call_tool
+
+
+@pytest.fixture(autouse=True)
+def clear_identity_caches():
+    server._identity_clients.clear()
+    server._compartment_ids.clear()
+    yield
+    server._identity_clients.clear()
+    server._compartment_ids.clear()
+
+
+@pytest.fixture
+def mock_stat():
+    # get_identity_client stamps clients with the key and token file mtimes; those files
+    # don't exist in tests
+    with patch("oracle.oci_identity_mcp_server.server.os.stat") as stat:
+        yield stat
+
+
+@pytest.fixture(scope="class")
+def patched_get_identity_client():
+    # patched once per test class instead of entered and exited around every test
+    with patch("oracle.oci_identity_mcp_server.server.get_identity_client") as get_identity_client:
+        yield get_identity_client
+
+
+@pytest.fixture
+def mock_client(patched_get_identity_client):
+    # a fresh SDK client mock per test, returned by the class-wide get_identity_client patch
+    patched_get_identity_client.reset_mock()
+    patched_get_identity_client.return_value = Mock(spec=IDENTITY_CLIENT_METHODS)
+    return patched_get_identity_client.return_value
@@ -7,24 +7,36 @@ https://oss.oracle.com/licenses/upl.
 import base64
 import json
 import os
-from unittest.mock import MagicMock, create_autospec, mock_open, patch
+from unittest.mock import MagicMock, call, create_autospec, mock_open, patch
 
 import oci
 import oracle.oci_identity_mcp_server.server as server
 import pytest
-from fastmcp import Client
 from fastmcp.exceptions import ToolError
-from oracle.oci_identity_mcp_server.server import mcp
+
+# SDK models shared by the tests; the tools only read them, so one instance serves every test
+ROOT_COMPARTMENT = oci.identity.models.Compartment(
+    id="tenancy1",
+    compartment_id=None,
+    name="Root Compartment",
+    description="Test compartment (root)",
+    lifecycle_state="ACTIVE",
+    time_created="1970-01-01T00:00:00",
+)
+TENANCY = oci.identity.models.Tenancy(
+    id="tenancy1",
+    name="Tenancy 1",
+    description="Test tenancy",
+    home_region_key="PHX",
+)
 
 
 class TestIdentityTools:
     @pytest.mark.asyncio
-    @patch("oracle.oci_identity_mcp_server.server.get_identity_client")
     @patch("oracle.oci_identity_mcp_server.server.oci.config.from_file")
-    async def test_list_compartments(self, mock_config_from_file, mock_get_client):
+    async def test_list_compartments(self, mock_config_from_file, mock_client, mcp_client):
+        # Goes through the MCP client transport end to end; other tests call tools in-process
         mock_config_from_file.return_value = {"tenancy": "test_tenancy"}
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
 
         mock_list_response = create_autospec(oci.response.Response)
         mock_get_response = create_autospec(oci.response.Response)
@@ -39,40 +51,28 @@ class TestIdentityTools:
             )
         ]
 
-        mock_get_response.data = oci.identity.models.Compartment(
-            id="tenancy1",
-            compartment_id=None,
-            name="Root Compartment",
-            description="Test compartment (root)",
-            lifecycle_state="ACTIVE",
-            time_created="1970-01-01T00:00:00",
-        )
+        mock_get_response.data = ROOT_COMPARTMENT
         mock_list_response.has_next_page = False
         mock_list_response.next_page = None
         mock_client.list_compartments.return_value = mock_list_response
         mock_client.get_compartment.return_value = mock_get_response
 
-        async with Client(mcp) as client:
-            result = (
-                await client.call_tool(
-                    "list_compartments",
-                    {
-                        "compartment_id": "test_tenancy",
-                        "compartment_id_in_subtree": True,
-                    },
-                )
-            ).structured_content["result"]
-
-            assert len(result) == 2
-            assert result[0]["id"] == "compartment1"
-            assert result[1]["id"] == "tenancy1"
+        result = (
+            await mcp_client.call_tool(
+                "list_compartments",
+                {
+                    "compartment_id": "test_tenancy",
+                    "compartment_id_in_subtree": True,
+                },
+            )
+        ).structured_content["result"]
 
-    @pytest.mark.asyncio
-    @patch("oracle.oci_identity_mcp_server.server.get_identity_client")
-    async def test_list_compartments_without_root(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
+        assert len(result) == 2
+        assert result[0]["id"] == "compartment1"
+        assert result[1]["id"] == "tenancy1"
 
+    @pytest.mark.asyncio
+    async def test_list_compartments_without_root(self, mock_client, call_tool):
         mock_list_response = create_autospec(oci.response.Response)
         mock_list_response.data = [
             oci.identity.models.Compartment(
@@ -88,38 +88,29 @@ class TestIdentityTools:
         mock_list_response.next_page = None
         mock_client.list_compartments.return_value = mock_list_response
 
-        async with Client(mcp) as client:
-            result = (
-                await client.call_tool(
-                    "list_compartments",
-                    {
-                        "compartment_id": "test_tenancy",
-                        "compartment_id_in_subtree": True,
-                        "include_root": False,
-                    },
-                )
-            ).structured_content["result"]
-
-            assert len(result) == 1
-            assert result[0]["id"] == "compartment1"
+        result = (
+            await call_tool(
+                "list_compartments",
+                {
+                    "compartment_id": "test_tenancy",
+                    "compartment_id_in_subtree": True,
+                    "include_root": False,
+                },
+            )
+        ).structured_content["result"]
+
+        assert len(result) == 1
+        assert result[0]["id"] == "compartment1"
 
     @pytest.mark.asyncio
     @patch("oracle.oci_identity_mcp_server.server.oci.config.from_file")
-    @patch("oracle.oci_identity_mcp_server.server.get_identity_client")
-    async def test_list_compartments_pagination_without_limit(self, mock_get_client, mock_config_from_file):
+    async def test_list_compartments_pagination_without_limit(
+        self, mock_config_from_file, mock_client, call_tool
+    ):
         mock_config_from_file.return_value = {"tenancy": "test_tenancy"}
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
 
         mock_get_response = create_autospec(oci.response.Response)
-        mock_get_response.data = oci.identity.models.Compartment(
-            id="tenancy1",
-            compartment_id=None,
-            name="Root Compartment",
-            description="Test compartment (root)",
-            lifecycle_state="ACTIVE",
-            time_created="1970-01-01T00:00:00",
-        )
+        mock_get_response.data = ROOT_COMPARTMENT
 
         # Page 1
         resp1 = create_autospec(oci.response.Response)
@@ -159,15 +150,14 @@ class TestIdentityTools:
         mock_client.list_compartments.side_effect = [resp1, resp2]
         mock_client.get_compartment.return_value = mock_get_response
 
-        async with Client(mcp) as client:
-            result = (
-                await client.call_tool(
-                    "list_compartments",
-                    {
-                        "compartment_id": "tenancy",
-                    },
-                )
-            ).structured_content["result"]
+        result = (
+            await call_tool(
+                "list_compartments",
+                {
+                    "compartment_id": "tenancy",
+                },
+            )
+        ).structured_content["result"]
 
         assert len(result) == 4
         assert [r["id"] for r in result] == ["c1", "c2", "c3", "tenancy1"]
@@ -182,21 +172,13 @@ class TestIdentityTools:
 
     @pytest.mark.asyncio
     @patch("oracle.oci_identity_mcp_server.server.oci.config.from_file")
-    @patch("oracle.oci_identity_mcp_server.server.get_identity_client")
-    async def test_list_compartments_limit_stops_pagination(self, mock_get_client, mock_config_from_file):
+    async def test_list_compartments_limit_stops_pagination(
+        self, mock_config_from_file, mock_client, call_tool
+    ):
         mock_config_from_file.return_value = {"tenancy": "test_tenancy"}
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
 
         mock_get_response = create_autospec(oci.response.Response)
-        mock_get_response.data = oci.identity.models.Compartment(
-            id="tenancy1",
-            compartment_id=None,
-            name="Root Compartment",
-            description="Test compartment (root)",
-            lifecycle_state="ACTIVE",
-            time_created="1970-01-01T00:00:00",
-        )
+        mock_get_response.data = ROOT_COMPARTMENT
 
         # Page 1
         resp1 = create_autospec(oci.response.Response)
@@ -237,16 +219,15 @@ class TestIdentityTools:
         mock_client.get_compartment.return_value = mock_get_response
 
         limit = 2
-        async with Client(mcp) as client:
-            result = (
-                await client.call_tool(
-                    "list_compartments",
-                    {
-                        "compartment_id": "tenancy",
-                        "limit": limit,
-                    },
-                )
-            ).structured_content["result"]
+        result = (
+            await call_tool(
+                "list_compartments",
+                {
+                    "compartment_id": "tenancy",
+                    "limit": limit,
+                },
+            )
+        ).structured_content["result"]
 
         assert len(result) == 3
         assert [r["id"] for r in result] == ["c1", "c2", "tenancy1"]
@@ -257,11 +238,7 @@ class TestIdentityTools:
         assert first_kwargs["page"] is None
 
     @pytest.mark.asyncio
-    @patch("oracle.oci_identity_mcp_server.server.get_identity_client")
-    async def test_list_availability_domains(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
+    async def test_list_availability_domains(self, mock_client, call_tool):
         mock_list_response = create_autospec(oci.response.Response)
         mock_list_response.data = [
             oci.identity.models.AvailabilityDomain(
@@ -272,130 +249,101 @@ class TestIdentityTools:
         ]
         mock_client.list_availability_domains.return_value = mock_list_response
 
-        async with Client(mcp) as client:
-            result = (
-                await client.call_tool(
-                    "list_availability_domains",
-                    {
-                        "compartment_id": "test_tenancy",
-                    },
-                )
-            ).structured_content["result"]
+        result = (
+            await call_tool(
+                "list_availability_domains",
+                {
+                    "compartment_id": "test_tenancy",
+                },
+            )
+        ).structured_content["result"]
 
-            assert len(result) == 1
-            assert result[0]["id"] == "ad1"
+        assert len(result) == 1
+        assert result[0]["id"] == "ad1"
 
     @pytest.mark.asyncio
-    @patch("oracle.oci_identity_mcp_server.server.get_identity_client")
-    async def test_list_compartments_exception_propagates(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-        mock_client.list_compartments.side_effect = RuntimeError("boom")
-
-        async with Client(mcp) as client:
-            with pytest.raises(ToolError):
-                await client.call_tool(
-                    "list_compartments",
-                    {
-                        "compartment_id": "tenancy",
-                    },
-                )
+    @pytest.mark.parametrize(
+        "tool, arguments, error",
+        [
+            ("list_compartments", {"compartment_id": "tenancy"}, RuntimeError("boom")),
+            ("get_tenancy", {"tenancy_id": "ocid1.tenancy"}, RuntimeError("boom")),
+            ("list_availability_domains", {"compartment_id": "ocid1.tenancy"}, ValueError("err")),
+        ],
+    )
+    async def test_tool_exception_propagates(self, mock_client, call_tool, tool, arguments, error):
+        # Each tool calls the SDK client method of the same name; make it raise
+        getattr(mock_client, tool).side_effect = error
 
-    @pytest.mark.asyncio
-    @patch("oracle.oci_identity_mcp_server.server.get_identity_client")
-    async def test_get_tenancy(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
+        with pytest.raises(ToolError):
+            await call_tool(tool, arguments)
 
+    @pytest.mark.asyncio
+    async def test_get_tenancy(self, mock_client, call_tool):
         mock_get_response = create_autospec(oci.response.Response)
-        mock_get_response.data = oci.identity.models.Tenancy(
-            id="tenancy1",
-            name="Tenancy 1",
-            description="Test tenancy",
-            home_region_key="PHX",
-        )
+        mock_get_response.data = TENANCY
         mock_client.get_tenancy.return_value = mock_get_response
 
-        async with Client(mcp) as client:
-            call_tool_result = await client.call_tool(
-                "get_tenancy",
-                {
-                    "tenancy_id": "test_tenancy",
-                },
-            )
-            result = call_tool_result.structured_content
+        call_tool_result = await call_tool(
+            "get_tenancy",
+            {
+                "tenancy_id": "test_tenancy",
+            },
+        )
+        result = call_tool_result.structured_content
 
-            assert result["id"] == "tenancy1"
+        assert result["id"] == "tenancy1"
 
     @pytest.mark.asyncio
-    @patch("oracle.oci_identity_mcp_server.server.get_identity_client")
     @patch("oracle.oci_identity_mcp_server.server.oci.config.from_file")
-    async def test_get_current_tenancy(self, mock_config_from_file, mock_get_client):
+    async def test_get_current_tenancy(self, mock_config_from_file, mock_client, call_tool):
         mock_config_from_file.return_value = {"tenancy": "test_tenancy"}
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
 
         mock_get_response = create_autospec(oci.response.Response)
-        mock_get_response.data = oci.identity.models.Tenancy(
-            id="tenancy1",
-            name="Tenancy 1",
-            description="Test tenancy",
-            home_region_key="PHX",
-        )
+        mock_get_response.data = TENANCY
         mock_client.get_tenancy.return_value = mock_get_response
 
-        async with Client(mcp) as client:
-            call_tool_result = await client.call_tool(
-                "get_current_tenancy",
-                {},
-            )
-            result = call_tool_result.structured_content
+        call_tool_result = await call_tool(
+            "get_current_tenancy",
+            {},
+        )
+        result = call_tool_result.structured_content
 
-            assert result["id"] == "tenancy1"
+        assert result["id"] == "tenancy1"
 
     @pytest.mark.asyncio
-    @patch("oracle.oci_identity_mcp_server.server.get_identity_client")
-    async def test_create_auth_token(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
+    async def test_create_auth_token(self, mock_client, call_tool):
         mock_create_response = create_autospec(oci.response.Response)
         mock_create_response.data = oci.identity.models.AuthToken(
             token="token1", description="Test token", lifecycle_state="ACTIVE"
         )
         mock_client.create_auth_token.return_value = mock_create_response
 
-        async with Client(mcp) as client:
-            call_tool_result = await client.call_tool(
-                "create_auth_token",
-                {
-                    "user_id": "test_user",
-                },
-            )
-            result = call_tool_result.structured_content
+        call_tool_result = await call_tool(
+            "create_auth_token",
+            {
+                "user_id": "test_user",
+            },
+        )
+        result = call_tool_result.structured_content
 
-            assert result["token"] == "token1"
+        assert result["token"] == "token1"
 
     @pytest.mark.asyncio
-    @patch("oracle.oci_identity_mcp_server.server.get_identity_client")
     @patch("oracle.oci_identity_mcp_server.server.oci.config.from_file")
-    async def test_get_current_user_from_config_user(self, mock_config_from_file, mock_get_client):
+    async def test_get_current_user_from_config_user(self, mock_config_from_file, mock_client, call_tool):
         mock_config_from_file.return_value = {"user": "test_user"}
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
 
         mock_get_response = create_autospec(oci.response.Response)
         mock_get_response.data = oci.identity.models.User(id="user1", name="User 1", description="Test user")
         mock_client.get_user.return_value = mock_get_response
 
-        async with Client(mcp) as client:
-            call_tool_result = await client.call_tool(
-                "get_current_user",
-                {},
-            )
-            result = call_tool_result.structured_content
+        call_tool_result = await call_tool(
+            "get_current_user",
+            {},
+        )
+        result = call_tool_result.structured_content
 
-            assert result["id"] == "user1"
+        assert result["id"] == "user1"
 
     def _make_jwt(self, payload_dict: dict) -> str:
         header_b64 = base64.urlsafe_b64encode(json.dumps({"alg": "none"}).encode()).decode().rstrip("=")
@@ -403,85 +351,59 @@ class TestIdentityTools:
         return f"{header_b64}.{payload_b64}.signature"
 
     @pytest.mark.asyncio
-    @patch("oracle.oci_identity_mcp_server.server.get_identity_client")
+    @pytest.mark.parametrize("claim", ["sub", "opc-user-id"])
     @patch("oracle.oci_identity_mcp_server.server.os.path.exists")
     @patch("oracle.oci_identity_mcp_server.server.oci.config.from_file")
-    async def test_get_current_user_fallback_from_token_sub(
-        self, mock_config_from_file, mock_path_exists, mock_get_client
-    ):
-        # No user in config, but provide a token file with JWT 'sub'
-        token = self._make_jwt({"sub": "ocid1.user.oc1..sub"})
-        mock_config_from_file.return_value = {
-            "security_token_file": "/tmp/token.txt",
-        }
-        mock_path_exists.return_value = True
-
-        m = mock_open(read_data=token)
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
-        mock_resp = create_autospec(oci.response.Response)
-        mock_resp.data = oci.identity.models.User(id="user-sub", name="User From Sub")
-        mock_client.get_user.return_value = mock_resp
-
-        with patch("builtins.open", m):
-            async with Client(mcp) as client:
-                result = (await client.call_tool("get_current_user", {})).structured_content
-                assert result["id"] == "user-sub"
-                # Ensure client.get_user called with derived OCID
-                mock_client.get_user.assert_called_once_with("ocid1.user.oc1..sub")
-
-    @pytest.mark.asyncio
-    @patch("oracle.oci_identity_mcp_server.server.get_identity_client")
-    @patch("oracle.oci_identity_mcp_server.server.os.path.exists")
-    @patch("oracle.oci_identity_mcp_server.server.oci.config.from_file")
-    async def test_get_current_user_fallback_from_token_opc_user_id(
-        self, mock_config_from_file, mock_path_exists, mock_get_client
+    async def test_get_current_user_fallback_from_token_claim(
+        self,
+        mock_config_from_file,
+        mock_path_exists,
+        mock_client,
+        call_tool,
+        claim,
     ):
-        token = self._make_jwt({"opc-user-id": "ocid1.user.oc1..opc"})
+        # No user in config, but provide a token file whose JWT carries the user OCID in the claim
+        token = self._make_jwt({claim: "ocid1.user.oc1..token"})
         mock_config_from_file.return_value = {
             "security_token_file": "/tmp/token.txt",
         }
         mock_path_exists.return_value = True
 
         m = mock_open(read_data=token)
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
 
         mock_resp = create_autospec(oci.response.Response)
-        mock_resp.data = oci.identity.models.User(id="user-opc", name="User From OPC")
+        mock_resp.data = oci.identity.models.User(id="user-token", name="User From Token")
         mock_client.get_user.return_value = mock_resp
 
         with patch("builtins.open", m):
-            async with Client(mcp) as client:
-                result = (await client.call_tool("get_current_user", {})).structured_content
-                assert result["id"] == "user-opc"
-                mock_client.get_user.assert_called_once_with("ocid1.user.oc1..opc")
+            result = (await call_tool("get_current_user", {})).structured_content
+            assert result["id"] == "user-token"
+            # Ensure client.get_user called with derived OCID
+            mock_client.get_user.assert_called_once_with("ocid1.user.oc1..token")
 
     @pytest.mark.asyncio
-    @patch("oracle.oci_identity_mcp_server.server.get_identity_client")
     @patch("oracle.oci_identity_mcp_server.server.os.path.exists")
     @patch("oracle.oci_identity_mcp_server.server.oci.config.from_file")
     async def test_get_current_user_raises_when_no_user(
-        self, mock_config_from_file, mock_path_exists, mock_get_client
+        self,
+        mock_config_from_file,
+        mock_path_exists,
+        mock_client,
+        call_tool,
     ):
         # No user in config, token file missing -> KeyError should propagate as ToolError
         mock_config_from_file.return_value = {"security_token_file": "/tmp/token.txt"}
         mock_path_exists.return_value = False
 
-        async with Client(mcp) as client:
-            with pytest.raises(ToolError):
-                await client.call_tool("get_current_user", {})
+        with pytest.raises(ToolError):
+            await call_tool("get_current_user", {})
 
     @pytest.mark.asyncio
-    @patch("oracle.oci_identity_mcp_server.server.get_identity_client")
-    async def test_get_compartment_by_name(self, mock_get_client):
+    async def test_get_compartment_by_name(self, mock_client, call_tool):
         """
         Tests finding a compartment by name, including simulating pagination
         where the target is on the second page.
         """
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
 
         mock_response_p1 = create_autospec(oci.response.Response)
         mock_response_p1.data = [oci.identity.models.Compartment(name="WrongName", id="wrong_id")]
@@ -502,60 +424,149 @@ class TestIdentityTools:
 
         mock_client.list_compartments.side_effect = [mock_response_p1, mock_response_p2]
 
-        async with Client(mcp) as client:
-            raw_content = (
-                await client.call_tool(
-                    "get_compartment_by_name",
-                    {
-                        "name": "TargetComp",
-                        "parent_compartment_id": "test_parent_id",
-                    },
-                )
-            ).structured_content
+        raw_content = (
+            await call_tool(
+                "get_compartment_by_name",
+                {
+                    "name": "TargetComp",
+                    "parent_compartment_id": "test_parent_id",
+                },
+            )
+        ).structured_content
+
+        result = raw_content.get("result", raw_content)
+
+        assert result["id"] == "target_id"
+        assert result["name"] == "TargetComp"
+
+        assert mock_client.list_compartments.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_compartment_by_name_reuses_recent_lookup(self, mock_client, call_tool):
+        target = oci.identity.models.Compartment(
+            name="TargetComp",
+            id="target_id",
+            compartment_id="test_parent_id",
+            lifecycle_state="ACTIVE",
+        )
+        list_response = create_autospec(oci.response.Response)
+        list_response.data = [target]
+        list_response.has_next_page = False
+        list_response.next_page = None
+        mock_client.list_compartments.return_value = list_response
+        get_response = create_autospec(oci.response.Response)
+        get_response.data = target
+        mock_client.get_compartment.return_value = get_response
+
+        arguments = {"name": "TargetComp", "parent_compartment_id": "test_parent_id"}
+        list_parent = call.list_compartments(
+            compartment_id="test_parent_id",
+            page=None,
+            access_level="ACCESSIBLE",
+            lifecycle_state="ACTIVE",
+        )
+        get_target = call.get_compartment("target_id")
+
+        # The second lookup falls within the TTL and gets the compartment directly
+        await call_tool("get_compartment_by_name", arguments)
+        raw_content = (await call_tool("get_compartment_by_name", arguments)).structured_content
+        result = raw_content.get("result", raw_content)
 
-            if "result" in raw_content:
-                result = raw_content["result"]
-            else:
-                result = raw_content
+        assert result["id"] == "target_id"
+        assert mock_client.mock_calls == [list_parent, get_target]
 
-            assert result["id"] == "target_id"
-            assert result["name"] == "TargetComp"
+        # Once the TTL has passed the parent's children are listed again
+        key = (*server._config_key(), "test_parent_id", "TargetComp")
+        stamp, compartment_id = server._compartment_ids[key]
+        server._compartment_ids[key] = (stamp - server.COMPARTMENT_ID_TTL, compartment_id)
+        await call_tool("get_compartment_by_name", arguments)
 
-            assert mock_client.list_compartments.call_count == 2
+        assert mock_client.mock_calls == [list_parent, get_target, list_parent]
 
     @pytest.mark.asyncio
-    @patch("oracle.oci_identity_mcp_server.server.get_identity_client")
-    async def test_get_compartment_by_name_not_found(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
+    async def test_get_compartment_by_name_relists_when_cached_id_is_gone(self, mock_client, call_tool):
+        moved = oci.identity.models.Compartment(
+            name="TargetComp",
+            id="new_target_id",
+            compartment_id="test_parent_id",
+            lifecycle_state="ACTIVE",
+        )
+        list_response = create_autospec(oci.response.Response)
+        list_response.data = [moved]
+        list_response.has_next_page = False
+        list_response.next_page = None
+        mock_client.list_compartments.return_value = list_response
+        mock_client.get_compartment.side_effect = oci.exceptions.ServiceError(
+            status=404,
+            code="NotAuthorizedOrNotFound",
+            headers={},
+            message="Not found",
+        )
 
+        # The cached compartment was deleted since; the parent's children are listed again
+        key = (*server._config_key(), "test_parent_id", "TargetComp")
+        server._compartment_ids[key] = (server.time.monotonic(), "old_target_id")
+        raw_content = (
+            await call_tool(
+                "get_compartment_by_name",
+                {"name": "TargetComp", "parent_compartment_id": "test_parent_id"},
+            )
+        ).structured_content
+        result = raw_content.get("result", raw_content)
+
+        assert result["id"] == "new_target_id"
+        mock_client.get_compartment.assert_called_once_with("old_target_id")
+        mock_client.list_compartments.assert_called_once()
+        assert server._compartment_ids[key][1] == "new_target_id"
+
+    @pytest.mark.asyncio
+    async def test_get_compartment_by_name_does_not_share_lookups_across_profiles(
+        self, mock_client, call_tool
+    ):
+        target = oci.identity.models.Compartment(
+            name="TargetComp",
+            id="target_id",
+            compartment_id="test_parent_id",
+            lifecycle_state="ACTIVE",
+        )
+        list_response = create_autospec(oci.response.Response)
+        list_response.data = [target]
+        list_response.has_next_page = False
+        list_response.next_page = None
+        mock_client.list_compartments.return_value = list_response
+
+        arguments = {"name": "TargetComp", "parent_compartment_id": "test_parent_id"}
+        await call_tool("get_compartment_by_name", arguments)
+        with patch.dict(os.environ, {"OCI_CONFIG_PROFILE": "OTHER_PROFILE"}):
+            await call_tool("get_compartment_by_name", arguments)
+
+        assert mock_client.list_compartments.call_count == 2
+        mock_client.get_compartment.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_compartment_by_name_not_found(self, mock_client, call_tool):
         resp = create_autospec(oci.response.Response)
         resp.data = []
         resp.has_next_page = False
         resp.next_page = None
         mock_client.list_compartments.return_value = resp
 
-        async with Client(mcp) as client:
-            raw_content = (
-                await client.call_tool(
-                    "get_compartment_by_name",
-                    {
-                        "name": "Missing",
-                        "parent_compartment_id": "ocid1.tenancy",
-                    },
-                )
-            ).structured_content
-
-            # Depending on FastMCP version, result may be nested
-            result = raw_content.get("result", raw_content)
-            assert result is None
+        raw_content = (
+            await call_tool(
+                "get_compartment_by_name",
+                {
+                    "name": "Missing",
+                    "parent_compartment_id": "ocid1.tenancy",
+                },
+            )
+        ).structured_content
 
-    @pytest.mark.asyncio
-    @patch("oracle.oci_identity_mcp_server.server.get_identity_client")
-    async def test_list_subscribed_regions(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
+        # Depending on FastMCP version, result may be nested
+        result = raw_content.get("result", raw_content)
+        assert result is None
 
+    @pytest.mark.asyncio
+    async def test_list_subscribed_regions(self, mock_client, call_tool):
         mock_list_response = create_autospec(oci.response.Response)
         mock_list_response.data = [
             oci.identity.models.RegionSubscription(
@@ -573,20 +584,19 @@ class TestIdentityTools:
         ]
         mock_client.list_region_subscriptions.return_value = mock_list_response
 
-        async with Client(mcp) as client:
-            result = (
-                await client.call_tool(
-                    "list_subscribed_regions",
-                    {
-                        "tenancy_id": "test_tenancy",
-                    },
-                )
-            ).structured_content["result"]
+        result = (
+            await call_tool(
+                "list_subscribed_regions",
+                {
+                    "tenancy_id": "test_tenancy",
+                },
+            )
+        ).structured_content["result"]
 
-            assert len(result) == 2
-            assert result[0]["region_name"] == "us-phoenix-1"
-            assert result[0]["is_home_region"] is True
-            assert result[1]["region_key"] == "IAD"
+        assert len(result) == 2
+        assert result[0]["region_name"] == "us-phoenix-1"
+        assert result[0]["is_home_region"] is True
+        assert result[1]["region_key"] == "IAD"
 
 
 class TestServer:
@@ -639,70 +649,38 @@ class TestServer:
 
 
 @pytest.mark.asyncio
-@patch("oracle.oci_identity_mcp_server.server.get_identity_client")
 @patch("oracle.oci_identity_mcp_server.server.oci.config.from_file")
-async def test_get_current_tenancy_with_env_override(mock_from_file, mock_get_client):
+async def test_get_current_tenancy_with_env_override(mock_from_file, mock_client, call_tool):
     mock_from_file.return_value = {"tenancy": "base-tenancy"}
-    mock_client = MagicMock()
-    mock_get_client.return_value = mock_client
 
     mock_get_response = create_autospec(oci.response.Response)
-    mock_get_response.data = oci.identity.models.Tenancy(
-        id="tenancy1",
-        name="Tenancy 1",
-        description="Test tenancy",
-        home_region_key="PHX",
-    )
+    mock_get_response.data = TENANCY
     mock_client.get_tenancy.return_value = mock_get_response
 
     with patch.dict(os.environ, {"TENANCY_ID_OVERRIDE": "ocid1.tenancy.oc1..override"}, clear=False):
-        async with Client(mcp) as client:
-            result = (await client.call_tool("get_current_tenancy", {})).structured_content
-            assert result["id"] == "tenancy1"
+        result = (await call_tool("get_current_tenancy", {})).structured_content
+        assert result["id"] == "tenancy1"
 
     mock_client.get_tenancy.assert_called_once_with("ocid1.tenancy.oc1..override")
 
 
 @pytest.mark.asyncio
-@patch("oracle.oci_identity_mcp_server.server.get_identity_client")
-async def test_get_tenancy_exception_propagates(mock_get_client):
-    mock_client = MagicMock()
-    mock_get_client.return_value = mock_client
-    mock_client.get_tenancy.side_effect = RuntimeError("boom")
-
-    async with Client(mcp) as client:
-        with pytest.raises(ToolError):
-            await client.call_tool("get_tenancy", {"tenancy_id": "ocid1.tenancy"})
-
-
-@pytest.mark.asyncio
-@patch("oracle.oci_identity_mcp_server.server.get_identity_client")
-async def test_list_availability_domains_exception_propagates(mock_get_client):
-    mock_client = MagicMock()
-    mock_get_client.return_value = mock_client
-    mock_client.list_availability_domains.side_effect = ValueError("err")
-
-    async with Client(mcp) as client:
-        with pytest.raises(ToolError):
-            await client.call_tool("list_availability_domains", {"compartment_id": "ocid1.tenancy"})
-
-
-@pytest.mark.asyncio
-@patch("oracle.oci_identity_mcp_server.server.get_identity_client")
 @patch("oracle.oci_identity_mcp_server.server.os.path.exists")
 @patch("oracle.oci_identity_mcp_server.server.oci.config.from_file")
-async def test_get_current_user_invalid_token_decode_raises(mock_from_file, mock_exists, mock_get_client):
+async def test_get_current_user_invalid_token_decode_raises(
+    mock_from_file, mock_exists, mock_client, call_tool
+):
     mock_from_file.return_value = {"security_token_file": "/tmp/token.txt"}
     mock_exists.return_value = True
     invalid_token = "a.b.c"  # invalid base64 payload to trigger decode error
 
     m = mock_open(read_data=invalid_token)
     with patch("builtins.open", m):
-        async with Client(mcp) as client:
-            with pytest.raises(ToolError):
-                await client.call_tool("get_current_user", {})
+        with pytest.raises(ToolError):
+            await call_tool("get_current_user", {})
 
 
+@pytest.mark.usefixtures("mock_stat")
 class TestGetClient:
     @patch("oracle.oci_identity_mcp_server.server.oci.identity.IdentityClient")
     @patch("oracle.oci_identity_mcp_server.server.oci.auth.signers.SecurityTokenSigner")
@@ -803,3 +781,46 @@ class TestGetClient:
         assert isinstance(config["additional_user_agent"], str) and "/" in config["additional_user_agent"]
         # Returned object is client instance
         assert srv_client is mock_client.return_value
+
+    @patch("oracle.oci_identity_mcp_server.server.oci.identity.IdentityClient")
+    @patch("oracle.oci_identity_mcp_server.server.oci.auth.signers.SecurityTokenSigner")
+    @patch("oracle.oci_identity_mcp_server.server.oci.signer.load_private_key_from_file")
+    @patch(
+        "oracle.oci_identity_mcp_server.server.open",
+        new_callable=mock_open,
+        read_data="TOK",
+    )
+    @patch("oracle.oci_identity_mcp_server.server.oci.config.from_file")
+    def test_get_identity_client_is_reused_until_token_changes(
+        self,
+        mock_from_file,
+        mock_open_file,
+        mock_load_private_key,
+        mock_security_token_signer,
+        mock_client,
+        mock_stat,
+    ):
+        mock_from_file.side_effect = lambda **kwargs: {
+            "key_file": "/k.pem",
+            "security_token_file": "/tkn",
+        }
+        mock_client.side_effect = lambda *args, **kwargs: MagicMock()
+        mock_stat.return_value.st_mtime_ns = 1
+
+        first = server.get_identity_client()
+        second = server.get_identity_client()
+
+        assert second is first
+        mock_client.assert_called_once()
+        mock_open_file.assert_called_once_with("/tkn", "r")
+
+        # A refreshed session token builds a new signer and client
+        mock_stat.return_value.st_mtime_ns = 2
+        third = server.get_identity_client()
+
+        assert third is not first
+        assert mock_client.call_count == 2
+
+        server._close_identity_clients()
+        third.base_client.session.close.assert_called_once()
+        assert server._identity_clients == {}
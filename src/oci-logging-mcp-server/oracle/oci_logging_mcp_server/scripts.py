@@ -4,6 +4,7 @@ Licensed under the Universal Permissive License v1.0 as shown at
 https://oss.oracle.com/licenses/upl.
 """
 
+from functools import lru_cache
 from pathlib import Path
 
 SCRIPTS_DIRECTORY = Path(__file__).parent / "scripts"
@@ -12,6 +13,8 @@ SEARCH_LOG_SCRIPT = "SEARCH_LOG.md"
 SEARCH_LOG_EVENT_TYPES_SCRIPT = "SEARCH_LOG_EVENT_TYPES.md"
 
 
+# The scripts ship with the package and don't change while the server runs, so each is read once
+@lru_cache(maxsize=None)
 def get_script_content(script_name: str) -> str:
     file_path = SCRIPTS_DIRECTORY / script_name
     with open(file_path, "r") as f:
@@ -11,6 +11,7 @@ import oracle.oci_logging_mcp_server.server as server
 import pytest
 from fastmcp import Client
 from fastmcp.exceptions import ToolError
+from oracle.oci_logging_mcp_server.scripts import SEARCH_LOG_SCRIPT, get_script_content
 from oracle.oci_logging_mcp_server.server import mcp
 
 
@@ -437,6 +438,22 @@ class TestLoggingTools:
         text = raw["result"] if isinstance(raw, dict) and "result" in raw else raw
         assert "Table not found in the guide." in text
 
+    def test_get_script_content_reads_each_script_once(self):
+        get_script_content.cache_clear()
+        try:
+            with patch(
+                "oracle.oci_logging_mcp_server.scripts.open",
+                new_callable=mock_open,
+                read_data="GUIDE CONTENT",
+            ) as mock_open_file:
+                assert get_script_content(SEARCH_LOG_SCRIPT) == "GUIDE CONTENT"
+                assert get_script_content(SEARCH_LOG_SCRIPT) == "GUIDE CONTENT"
+
+            mock_open_file.assert_called_once()
+        finally:
+            # don't leave the mocked content cached for other tests
+            get_script_content.cache_clear()
+
 
 class TestServer:
     @patch("oracle.oci_logging_mcp_server.server.mcp.run")
@@ -286,10 +286,28 @@ class TestServer:
 
 
 class TestReadFile:
+    @pytest.fixture(autouse=True)
+    def clear_script_cache(self):
+        # get_script_content is memoized; don't let one test see another's (mocked) content
+        get_script_content.cache_clear()
+        yield
+        get_script_content.cache_clear()
+
     def test_read_file(self):
         document = get_script_content(MQL_QUERY_DOC)
         assert document is not None
 
+    def test_get_script_content_reads_each_script_once(self):
+        with patch(
+            "oracle.oci_monitoring_mcp_server.scripts.open",
+            new_callable=mock_open,
+            read_data="GUIDE CONTENT",
+        ) as mock_open_file:
+            assert get_script_content(MQL_QUERY_DOC) == "GUIDE CONTENT"
+            assert get_script_content(MQL_QUERY_DOC) == "GUIDE CONTENT"
+
+        mock_open_file.assert_called_once()
+
 
 class TestGetClient:
     @patch("oracle.oci_monitoring_mcp_server.server.oci.monitoring.MonitoringClient")
@@ -5,6 +5,7 @@ https://oss.oracle.com/licenses/upl.
 """
 
 import os
+from functools import lru_cache
 from logging import Logger
 from typing import Annotated, List
 
@@ -28,6 +29,9 @@ logger = Logger(__name__, level="INFO")
 
 mcp = FastMCP(name=__project__)
 
+# Number of parts uploaded concurrently for multipart uploads
+UPLOAD_PARALLEL_PROCESS_COUNT = 8
+
 
 def get_object_storage_client():
     config = oci.config.from_file(
@@ -48,6 +52,15 @@ def get_object_storage_client():
 
 # Object storage namespace
 def get_object_storage_namespace(compartment_id: str):
+    config_file = os.getenv("OCI_CONFIG_FILE", oci.config.DEFAULT_LOCATION)
+    profile = os.getenv("OCI_CONFIG_PROFILE", oci.config.DEFAULT_PROFILE)
+    return _get_cached_namespace(config_file, profile, compartment_id)
+
+
+# The namespace of a tenancy never changes, so it is looked up once per config file, profile and
+# compartment. Failed lookups raise and are therefore not cached.
+@lru_cache(maxsize=32)
+def _get_cached_namespace(config_file: str, profile: str, compartment_id: str):
     object_storage_client = get_object_storage_client()
     namespace = object_storage_client.get_namespace(compartment_id=compartment_id)
     return namespace.data
@@ -196,8 +209,13 @@ def upload_object(
     logger.info("Got Namespace: %s", namespace_name)
     logger.info("Checking file at path: %s", file_path)
     try:
-        with open(file_path, "rb") as file:
-            object_storage_client.put_object(namespace_name, bucket_name, object_name, file)
+        # small files go up in a single put_object call; large ones as a parallel multipart upload
+        upload_manager = oci.object_storage.UploadManager(
+            object_storage_client,
+            allow_parallel_uploads=True,
+            parallel_process_count=UPLOAD_PARALLEL_PROCESS_COUNT,
+        )
+        upload_manager.upload_file(namespace_name, bucket_name, object_name, file_path)
         return {"message": "Object uploaded successfully"}
     except Exception as e:
         return {"error": str(e)}
@@ -0,0 +1,16 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import pytest
+from oracle.oci_object_storage_mcp_server import server
+
+
+@pytest.fixture(autouse=True)
+def _clear_namespace_cache():
+    # the namespace cache must not leak mocked clients between tests
+    server._get_cached_namespace.cache_clear()
+    yield
+    server._get_cached_namespace.cache_clear()
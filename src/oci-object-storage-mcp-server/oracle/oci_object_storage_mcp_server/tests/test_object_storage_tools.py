@@ -38,6 +38,42 @@ class TestObjectStorageTools:
 
         assert result == "test_namespace"
 
+    @pytest.mark.asyncio
+    @patch("oracle.oci_object_storage_mcp_server.server.get_object_storage_client")
+    async def test_get_namespace_is_cached_per_compartment(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+
+        mock_namespace_response = create_autospec(oci.response.Response)
+        mock_namespace_response.data = "test_namespace"
+        mock_client.get_namespace.return_value = mock_namespace_response
+
+        async with Client(mcp) as client:
+            for _ in range(2):
+                await client.call_tool("get_namespace", {"compartment_id": "test_compartment"})
+            await client.call_tool("get_namespace", {"compartment_id": "other_compartment"})
+
+        assert mock_client.get_namespace.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch("oracle.oci_object_storage_mcp_server.server.get_object_storage_client")
+    async def test_get_namespace_is_cached_per_config_file(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+
+        mock_namespace_response = create_autospec(oci.response.Response)
+        mock_namespace_response.data = "test_namespace"
+        mock_client.get_namespace.return_value = mock_namespace_response
+
+        # Another config file may point the same profile name at another tenancy
+        async with Client(mcp) as client:
+            with patch.dict("os.environ", {"OCI_CONFIG_FILE": "/tenancy1/config"}):
+                await client.call_tool("get_namespace", {"compartment_id": "test_compartment"})
+            with patch.dict("os.environ", {"OCI_CONFIG_FILE": "/tenancy2/config"}):
+                await client.call_tool("get_namespace", {"compartment_id": "test_compartment"})
+
+        assert mock_client.get_namespace.call_count == 2
+
     @pytest.mark.asyncio
     @patch("oracle.oci_object_storage_mcp_server.server.get_object_storage_client")
     async def test_list_buckets(self, mock_get_client):
@@ -235,6 +271,45 @@ class TestObjectStorageTools:
         assert result["message"] == "Object uploaded successfully"
         mock_client.put_object.assert_called_once()
 
+    @pytest.mark.asyncio
+    @patch("oracle.oci_object_storage_mcp_server.server.oci.object_storage.UploadManager")
+    @patch("oracle.oci_object_storage_mcp_server.server.get_object_storage_client")
+    async def test_upload_object_uses_parallel_upload_manager(
+        self, mock_get_client, mock_upload_manager, tmp_path
+    ):
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+
+        mock_namespace_response = create_autospec(oci.response.Response)
+        mock_namespace_response.data = "test_namespace"
+        mock_client.get_namespace.return_value = mock_namespace_response
+
+        p = tmp_path / "file.bin"
+        p.write_bytes(b"data")
+
+        async with Client(mcp) as client:
+            result = (
+                await client.call_tool(
+                    "upload_object",
+                    {
+                        "bucket_name": "bucket1",
+                        "compartment_id": "test_compartment",
+                        "file_path": str(p),
+                        "object_name": "file.bin",
+                    },
+                )
+            ).structured_content
+
+        assert result["message"] == "Object uploaded successfully"
+        mock_upload_manager.assert_called_once_with(
+            mock_client,
+            allow_parallel_uploads=True,
+            parallel_process_count=server.UPLOAD_PARALLEL_PROCESS_COUNT,
+        )
+        mock_upload_manager.return_value.upload_file.assert_called_once_with(
+            "test_namespace", "bucket1", "file.bin", str(p)
+        )
+
     @pytest.mark.asyncio
     @patch("oracle.oci_object_storage_mcp_server.server.get_object_storage_client")
     async def test_upload_object_error(self, mock_get_client, tmp_path):
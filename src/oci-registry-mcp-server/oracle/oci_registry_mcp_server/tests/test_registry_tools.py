@@ -133,7 +133,7 @@ class TestRegistryTools:
             )
             assert call_tool_result.is_error is True
             # The error text is present in the first content block
-            assert any(getattr(block, "text", "").find("boom") != -1 for block in call_tool_result.content)
+            assert "boom" in call_tool_result.content[0].text
 
     @pytest.mark.asyncio
     @patch("oracle.oci_registry_mcp_server.server.get_ocir_client")
@@ -149,7 +149,7 @@ class TestRegistryTools:
                 raise_on_error=False,
             )
             assert res.is_error is True
-            assert any(getattr(b, "text", "").find("oops") != -1 for b in res.content)
+            assert "oops" in res.content[0].text
 
     @pytest.mark.asyncio
     @patch("oracle.oci_registry_mcp_server.server.get_ocir_client")
@@ -169,7 +169,7 @@ class TestRegistryTools:
                 raise_on_error=False,
             )
             assert res.is_error is True
-            assert any(getattr(b, "text", "").find("fail") != -1 for b in res.content)
+            assert "fail" in res.content[0].text
 
     @pytest.mark.asyncio
     @patch("oracle.oci_registry_mcp_server.server.get_ocir_client")
@@ -185,7 +185,7 @@ class TestRegistryTools:
                 raise_on_error=False,
             )
             assert res.is_error is True
-            assert any(getattr(b, "text", "").find("nope") != -1 for b in res.content)
+            assert "nope" in res.content[0].text
 
 
 class TestServer:
@@ -19,15 +19,16 @@
 # limitations under the License.
 
 import argparse
+import functools
 import hashlib
 import logging
+import logging.config
+import os
 import re
 import tempfile
 import zipfile
 from pathlib import Path, PurePath
 
-import markdownify as md
-from bs4 import BeautifulSoup
 from fastmcp import FastMCP
 from pocketsearch import PocketSearch, PocketWriter
 from pydantic import Field
@@ -234,8 +235,8 @@ def update_content(location: Path) -> None:
     logger.debug("Updating content")
 
     files_processed = 0
-    for file in location.rglob("*"):
-        process_file(file)
+    for _, path in iter_files(location):
+        process_file(Path(path))
         files_processed += 1
     logger.info(f"Processed {files_processed} files from '{location}'.")
 
@@ -274,19 +275,61 @@ def update_index(content: list[str]) -> None:
             writer.insert(text=segment)
 
 
+def iter_files(directory: Path):
+    """Walk a directory tree with os.scandir and yield the files in it.
+
+    Args:
+        directory (Path): The directory to walk.
+
+    Yields:
+        tuple[str, str]: The relative and the full path of each file.
+    """
+    base = os.fspath(directory)
+    prefix_len = len(os.path.join(base, ""))
+    stack = [base]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry.path[prefix_len:], entry.path
+        except OSError:
+            # Unreadable directories (or a file passed as the directory) hold no files
+            continue
+
+
 def shasum_directory(directory: Path) -> str:
     """Calculate the SHA256 checksum of all files in a directory."""
     sha256 = hashlib.sha256()
-    for file in sorted(directory.rglob("*")):
-        if file.is_file():
-            # Include relative path for uniqueness
-            sha256.update(str(file.relative_to(directory)).encode())
-            with file.open("rb") as f:
-                while chunk := f.read(8192):
-                    sha256.update(chunk)
+    # Sort by path components to keep the same order as sorting Path objects
+    files = sorted(iter_files(directory), key=lambda f: f[0].split(os.sep))
+    for relative_path, path in files:
+        # Include relative path for uniqueness
+        sha256.update(relative_path.encode())
+        with open(path, "rb") as f:
+            while chunk := f.read(8192):
+                sha256.update(chunk)
     return sha256.hexdigest()
 
 
+@functools.cache
+def _markdownify():
+    """Import markdownify on first use, it is only needed when building the index."""
+    from markdownify import markdownify
+
+    return markdownify
+
+
+@functools.cache
+def _beautiful_soup():
+    """Import BeautifulSoup on first use, it is only needed when building the index."""
+    from bs4 import BeautifulSoup
+
+    return BeautifulSoup
+
+
 def convert_to_markdown_chunks(file: Path) -> list[str]:
     """Convert an HTML file to Markdown format.
 
@@ -306,7 +349,7 @@ def convert_to_markdown_chunks(file: Path) -> list[str]:
             html = preprocess_html(html)
 
         # Convert HTML to Markdown
-        markdown = md.markdownify(html)
+        markdown = _markdownify()(html)
         if PREPROCESS != "NONE":
             # Remove URLs from markdown
             markdown = remove_markdown_urls(markdown)
@@ -367,7 +410,7 @@ def preprocess_html(html_content: str) -> str:
     Returns:
         str: Cleaned HTML content ready for markdown conversion.
     """
-    soup = BeautifulSoup(html_content, "html.parser")
+    soup = _beautiful_soup()(html_content, "html.parser")
 
     # Remove script and style tags
     for tag in soup.find_all(["script", "style"]):
@@ -534,21 +577,35 @@ def main():
     # Build the home directory structure, needed also for the log file
     build_folder_structure()
 
-    # Set up logging
-    ch = logging.StreamHandler()
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
-    ch.setFormatter(formatter)
-    logger.addHandler(ch)
-
-    # Set log level
-    logging.basicConfig(
-        filename=HOME_DIR.joinpath(Path("oracle-db-doc-mcp-server.log")),
-        filemode="w",
-        level=logging.ERROR,
+    # Set up logging: console output for this module, errors of all loggers to the log file
+    logging.config.dictConfig(
+        {
+            "version": 1,
+            "disable_existing_loggers": False,
+            "formatters": {
+                "console": {
+                    "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+                },
+                "file": {"format": logging.BASIC_FORMAT},
+            },
+            "handlers": {
+                "console": {"class": "logging.StreamHandler", "formatter": "console"},
+                "file": {
+                    "class": "logging.FileHandler",
+                    "filename": str(HOME_DIR / "oracle-db-doc-mcp-server.log"),
+                    "mode": "w",
+                    "formatter": "file",
+                },
+            },
+            "root": {"level": "ERROR", "handlers": ["file"]},
+            "loggers": {
+                logger.name: {
+                    "level": getattr(logging, args.log_level.upper(), logging.ERROR),
+                    "handlers": ["console"],
+                }
+            },
+        }
     )
-    logger.setLevel(getattr(logging, args.log_level.upper(), logging.ERROR))
 
     if args.command == "idx":
         global PREPROCESS